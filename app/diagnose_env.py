@@ -2,27 +2,26 @@ from __future__ import annotations
 
 import json
 import platform
-import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from pathlib import Path
 from typing import Any
 
 APP_DIR = Path(__file__).resolve().parent
-if str(APP_DIR) not in sys.path:
+try:
+    from kick_browser import KickBrowserClient, KickBrowserError
+except ImportError:
+    # Only mutate sys.path on the cold failure path (e.g. launched from repo root).
     sys.path.insert(0, str(APP_DIR))
+    from kick_browser import KickBrowserClient, KickBrowserError
 
-from kick_browser import KickBrowserClient, KickBrowserError
+# Failure classes that guarantee the offscreen check would fail the same way
+# (missing browser binary, missing selenium, driver/browser mismatch).
+HARD_FAILURE_TYPES = {"FileNotFoundError", "ImportError", "ModuleNotFoundError", "SessionNotCreatedException"}
 
 
-def run_cmd(cmd: list[str]) -> str:
-    try:
-        out = subprocess.check_output(cmd, stderr=subprocess.STDOUT, text=True, timeout=20)
-        return out.strip()
-    except Exception as exc:
-        return f"ERROR: {exc}"
-
-
-def check_browser(client: KickBrowserClient, mode: str) -> dict[str, Any]:
+def check_browser(client: KickBrowserClient, mode: str, *, prime_cookies: bool = True) -> dict[str, Any]:
     driver = None
     try:
         if mode == "headless":
@@ -31,7 +30,8 @@ def check_browser(client: KickBrowserClient, mode: str) -> dict[str, Any]:
             driver = client.create_offscreen_driver(profile_name="diag-offscreen")
         else:
             raise ValueError(mode)
-        client.prime_session_with_cookies(driver)
+        if prime_cookies:
+            client.prime_session_with_cookies(driver)
         campaigns = client._fetch_response_in_page(
             driver,
             "https://web.kick.com/api/v1/drops/campaigns",
@@ -43,7 +43,7 @@ def check_browser(client: KickBrowserClient, mode: str) -> dict[str, Any]:
             "preview": str(campaigns.get("text") or "")[:160],
         }
     except Exception as exc:
-        return {"ok": False, "error": f"{exc.__class__.__name__}: {exc}"}
+        return {"ok": False, "error_type": exc.__class__.__name__, "error": str(exc)}
     finally:
         if driver is not None:
             try:
@@ -55,14 +55,40 @@ def check_browser(client: KickBrowserClient, mode: str) -> dict[str, Any]:
 def main() -> None:
     base = Path(__file__).resolve().parent.parent
     client = KickBrowserClient(base)
+    has_cookies = client.has_saved_cookies()
+    # Each check boots its own driver (distinct profile dirs), so both can run
+    # in parallel and the wall time is max() of the two instead of the sum.
+    # Hard failures (no browser binary, no selenium) surface within the first
+    # second, so peek at the headless result briefly before paying for the
+    # second driver boot; on healthy environments the peek times out and the
+    # offscreen check still overlaps with the headless one.
+    checks: dict[str, dict[str, Any]] = {}
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        headless_future = pool.submit(check_browser, client, "headless", prime_cookies=has_cookies)
+        skip_offscreen = False
+        try:
+            early = headless_future.result(timeout=1.0)
+            skip_offscreen = not early.get("ok") and early.get("error_type") in HARD_FAILURE_TYPES
+        except FutureTimeoutError:
+            pass
+        if skip_offscreen:
+            checks["offscreen"] = {
+                "skipped": True,
+                "reason": f"headless check failed with {headless_future.result().get('error_type')}",
+            }
+        else:
+            checks["offscreen"] = pool.submit(
+                check_browser, client, "offscreen", prime_cookies=has_cookies
+            ).result()
+        checks["headless"] = headless_future.result()
     report: dict[str, Any] = {
-        "python": run_cmd(["python", "--version"]),
+        "python": platform.python_version(),
         "platform": platform.platform(),
-        "cookies_file_exists": client.has_saved_cookies(),
+        "cookies_file_exists": has_cookies,
         "cookies_file": str(client.cookie_file),
         "session_status": client.get_session_status(),
-        "check_headless_fetch": check_browser(client, "headless"),
-        "check_offscreen_fetch": check_browser(client, "offscreen"),
+        "check_headless_fetch": checks["headless"],
+        "check_offscreen_fetch": checks["offscreen"],
     }
     print(json.dumps(report, ensure_ascii=False, indent=2))
 
@@ -2,33 +2,46 @@
 
 import json
 import io
+import os
+import re
+import sys
 import time
+import functools
 import queue
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import thread as _futures_thread
 import traceback
 import logging
 import hashlib
+import weakref
 import webbrowser
 from dataclasses import dataclass, field
 from pathlib import Path
-from urllib.parse import urlparse, urljoin
+from typing import NamedTuple
+from urllib.parse import urljoin
 from datetime import datetime, timezone
 
 import tkinter as tk
 from tkinter import ttk, messagebox, simpledialog
 from tkinter.scrolledtext import ScrolledText
 import tkinter.font as tkfont
-import sys
-import ctypes
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 from PIL import Image, ImageTk
 
 from kick_browser import KickBrowserClient
 from kick_models import (
+    AUTO_GAMES_CHANNEL_SOURCE,
     QueueItem,
     KickChannel,
     KickCampaign,
     KickProgressCampaign,
+    KickProgressReward,
     parse_campaigns_response,
     parse_progress_response,
     merge_campaigns_with_progress,
@@ -39,7 +52,6 @@ logger = logging.getLogger("KickDrops")
 
 ALL_GAMES_TOKEN = "__ALL_GAMES__"
 ALL_GAMES_LABEL = "Todos"
-AUTO_GAMES_CHANNEL_SOURCE = "source=auto-games-channel"
 
 UI_ES_TO_EN: dict[str, str] = {
     "Sesion: no comprobada": "Session: not checked",
@@ -116,9 +128,21 @@ UI_ES_TO_EN: dict[str, str] = {
     "URL inválida": "Invalid URL",
     "Error": "Error",
     "Importar cookies": "Import cookies",
+    "Ver drops": "Show drops",
+    "Ocultar drops": "Hide drops",
 }
 UI_EN_TO_ES: dict[str, str] = {v: k for k, v in UI_ES_TO_EN.items()}
 
+# Translation keys sorted longest-first, computed once at import time; the
+# tables are immutable so there is nothing to re-sort at call time.
+_UI_ES_TO_EN_KEYS: tuple[str, ...] = tuple(sorted(UI_ES_TO_EN, key=len, reverse=True))
+_UI_EN_TO_ES_KEYS: tuple[str, ...] = tuple(sorted(UI_EN_TO_ES, key=len, reverse=True))
+
+# Single-pass substitution patterns, alternating all keys longest-first so a
+# longer phrase always wins over any of its substrings.
+_UI_ES_TO_EN_RE = re.compile("|".join(map(re.escape, _UI_ES_TO_EN_KEYS)))
+_UI_EN_TO_ES_RE = re.compile("|".join(map(re.escape, _UI_EN_TO_ES_KEYS)))
+
 
 @dataclass(slots=True)
 class AppConfig:
@@ -151,12 +175,29 @@ class AppConfig:
             "auto_refresh_seconds": self.auto_refresh_seconds,
             "login_username": self.login_username,
             "auto_game_mining": self.auto_game_mining,
-            "preferred_games": list(self.preferred_games),
+            # Serializers only read this; no need to copy per save.
+            "preferred_games": self.preferred_games,
             "language": self.language,
         }
 
     @classmethod
     def from_dict(cls, data: dict[str, object]) -> "AppConfig":
+        # JSON decoded by the stdlib/orjson already yields the exact builtin
+        # types these fields expect, so only coerce when the type mismatches.
+        def _bool(key: str, default: bool) -> bool:
+            v = data.get(key, default)
+            return v if type(v) is bool else bool(v)
+
+        def _int(key: str, default: int) -> int:
+            v = data.get(key, default)
+            if type(v) is int:
+                return v or default
+            return int(v or default)
+
+        def _str(key: str, default: str) -> str:
+            v = data.get(key) or default
+            return v if type(v) is str else str(v)
+
         raw_items = data.get("queue_items") or data.get("items") or []
         items: list[QueueItem] = []
         if isinstance(raw_items, list):
@@ -166,33 +207,43 @@ class AppConfig:
                         items.append(QueueItem.from_dict(raw))
                     except Exception:
                         continue
+        raw_games = data.get("preferred_games")
+        preferred_games: list[str] = []
+        if isinstance(raw_games, list):
+            for v in raw_games:
+                game = v.strip() if type(v) is str else str(v).strip()
+                if game:
+                    preferred_games.append(game)
         return cls(
             queue_items=items,
-            hide_player=bool(data.get("hide_player", False)),
-            auto_claim=bool(data.get("auto_claim", False)),
-            default_minutes=int(data.get("default_minutes", 120) or 120),
-            watch_tick_seconds=int(data.get("watch_tick_seconds", 60) or 60),
-            poll_interval_seconds=int(data.get("poll_interval_seconds", 20) or 20),
-            browser_cookie_source=str(data.get("browser_cookie_source") or "chrome"),
-            show_browser_window=bool(data.get("show_browser_window", False)),
-            auto_refresh_progress=bool(data.get("auto_refresh_progress", True)),
-            auto_refresh_seconds=int(data.get("auto_refresh_seconds", 120) or 120),
-            login_username=str(data.get("login_username") or "").strip(),
-            auto_game_mining=bool(data.get("auto_game_mining", False)),
-            preferred_games=[
-                str(v).strip()
-                for v in (data.get("preferred_games") or [])
-                if str(v).strip()
-            ] if isinstance(data.get("preferred_games"), list) else [],
-            language=str(data.get("language") or "en").strip().lower() or "en",
+            hide_player=_bool("hide_player", False),
+            auto_claim=_bool("auto_claim", False),
+            default_minutes=_int("default_minutes", 120),
+            watch_tick_seconds=_int("watch_tick_seconds", 60),
+            poll_interval_seconds=_int("poll_interval_seconds", 20),
+            browser_cookie_source=_str("browser_cookie_source", "chrome"),
+            show_browser_window=_bool("show_browser_window", False),
+            auto_refresh_progress=_bool("auto_refresh_progress", True),
+            auto_refresh_seconds=_int("auto_refresh_seconds", 120),
+            login_username=_str("login_username", "").strip(),
+            auto_game_mining=_bool("auto_game_mining", False),
+            preferred_games=preferred_games,
+            language=_str("language", "en").strip().lower() or "en",
         )
 
 
+_TWO_DIGIT: tuple[str, ...] = tuple(f"{i:02}" for i in range(100))
+
+
+@functools.lru_cache(maxsize=4096)
 def _fmt_seconds(seconds: int) -> str:
-    seconds = max(0, int(seconds))
-    h, rem = divmod(seconds, 3600)
-    m, s = divmod(rem, 60)
-    return f"{h:02}:{m:02}:{s:02}"
+    total = max(0, int(seconds))
+    h = total // 3600
+    rem = total - h * 3600
+    m = rem // 60
+    s = rem - m * 60
+    hours = _TWO_DIGIT[h] if h < 100 else str(h)
+    return f"{hours}:{_TWO_DIGIT[m]}:{_TWO_DIGIT[s]}"
 
 
 def _fmt_exc(exc: Exception) -> str:
@@ -216,6 +267,47 @@ def _resource_base_dir() -> Path:
     return _app_base_dir()
 
 
+@functools.lru_cache(maxsize=1)
+def _preferred_ui_family() -> str:
+    """Pick the UI font family, probing Tk at most once per process.
+
+    Probes each candidate with a throwaway Font instead of enumerating
+    every installed family — tkfont.families() can block for hundreds of
+    ms on font-heavy systems. Tk substitutes another family in actual()
+    when the requested one is missing, so a mismatch means "not
+    installed". Requires a live default root.
+    """
+    for candidate in ("Segoe UI", "Tahoma"):
+        probe = tkfont.Font(family=candidate)
+        if probe.actual("family").lower() == candidate.lower():
+            return candidate
+    return "TkDefaultFont"
+
+
+def _load_cached_ui_family(base_dir: Path) -> str | None:
+    # Warm starts skip the Tk font probe entirely; the answer only changes
+    # when fonts are (un)installed, so it is re-validated against the Tk
+    # version and platform rather than recomputed every launch.
+    try:
+        data = json.loads((base_dir / "ui_font.json").read_text(encoding="utf-8"))
+    except Exception:
+        return None
+    if data.get("tk_version") != tk.TkVersion or data.get("platform") != sys.platform:
+        return None
+    family = data.get("family")
+    return family if isinstance(family, str) and family else None
+
+
+def _store_cached_ui_family(base_dir: Path, family: str) -> None:
+    payload = {"family": family, "tk_version": tk.TkVersion, "platform": sys.platform}
+    try:
+        (base_dir / "ui_font.json").write_text(
+            json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8"
+        )
+    except OSError:
+        pass
+
+
 def _apply_window_icon(root: tk.Tk) -> None:
     resource_dir = _resource_base_dir()
     icon_ico = resource_dir / "icons" / "pickaxe.ico"
@@ -238,19 +330,93 @@ def _apply_window_icon(root: tk.Tk) -> None:
             pass
 
 
+_KICK_URL_RE = re.compile(r"^https?://(?:www\.)?kick\.com/([^/?#\s]+)", re.IGNORECASE)
+
+# Scheme/netloc/rest splitter for thumbnail URLs; cheaper than a full
+# urlparse when all we need is the scheme check and the path.
+_THUMB_URL_RE = re.compile(r"^(https?):/+([^/?#]*)([^?#]*)", re.IGNORECASE)
+
+# Status groupings used on per-tick paths; hoisted so the hot loops don't
+# rebuild the set literals on every call.
+_FINAL_STATUSES = frozenset({"FINISHED", "EXPIRED"})
+_ACTIVE_STATUSES = frozenset({"LIVE", "CONNECTING", "RETRY", "WRONG_CATEGORY"})
+_LOGGED_OUT_STATES = frozenset({"logged_out", "no_session"})
+_FINISHED_PROGRESS_STATUSES = frozenset({"claimed", "completed", "finished", "done"})
+_TAGGABLE_STATUSES = frozenset({"LIVE", "FINISHED", "EXPIRED", "RETRY", "WRONG_CATEGORY", "CONNECTING"})
+_FINISHED_CAMPAIGN_TOKENS = frozenset({"claimed", "completed", "finished", "done", "expired", "ended"})
+_ACTIVE_CAMPAIGN_TOKENS = frozenset({"in_progress", "active", "running", "ongoing"})
+
+# The queue tree only ever emits status x live-state tag combinations, a
+# closed set of ~21 tuples; intern them instead of allocating per row.
+_QUEUE_TAG_POOL: dict[tuple[str, str], tuple[str, ...]] = {}
+
+
+def _queue_row_tags(status_tag: str, live_tag: str) -> tuple[str, ...]:
+    key = (status_tag, live_tag)
+    tags = _QUEUE_TAG_POOL.get(key)
+    if tags is None:
+        tags = (status_tag, live_tag) if status_tag else (live_tag,)
+        _QUEUE_TAG_POOL[key] = tags
+    return tags
+
+# Kick timestamps that fromisoformat rejects still look ISO-ish; one match
+# here replaces the old strptime fallback chain.
+_KICK_DATETIME_RE = re.compile(
+    r"^(\d{4})-(\d{2})-(\d{2})[ T](\d{2}):(\d{2}):(\d{2})(?:\.(\d+))?"
+)
+
+
 def normalize_kick_url(text: str) -> str:
     value = (text or "").strip()
     if not value:
         raise ValueError("URL vacía")
     if "://" not in value:
         value = f"https://kick.com/{value.lstrip('/')}"
-    parsed = urlparse(value)
-    if "kick.com" not in parsed.netloc.lower():
-        raise ValueError("Solo se admiten URLs de kick.com")
-    slug = parsed.path.strip("/").split("/")[0].strip()
-    if not slug:
+    m = _KICK_URL_RE.match(value)
+    if m is None:
+        if "kick.com" not in value.lower():
+            raise ValueError("Solo se admiten URLs de kick.com")
         raise ValueError("URL de canal inválida")
-    return f"https://kick.com/{slug}"
+    return f"https://kick.com/{m.group(1)}"
+
+
+class _DaemonThreadPoolExecutor(ThreadPoolExecutor):
+    """ThreadPoolExecutor whose workers never block process exit.
+
+    Stock executor workers are non-daemon threads that the interpreter
+    joins at shutdown, and shutdown(cancel_futures=True) cannot interrupt
+    a task that is already running — a login wait or a slow thumbnail
+    fetch would keep a windowless process alive after the window closes.
+    Spawning the workers as daemon threads (and skipping the module's
+    join-at-exit registry) restores the exit behavior of the plain daemon
+    threads these pools replaced.
+    """
+
+    def _adjust_thread_count(self) -> None:
+        # Mirrors ThreadPoolExecutor._adjust_thread_count, with daemon=True
+        # and without the _threads_queues atexit registration.
+        if self._idle_semaphore.acquire(timeout=0):
+            return
+
+        def weakref_cb(_, q=self._work_queue):
+            q.put(None)
+
+        num_threads = len(self._threads)
+        if num_threads < self._max_workers:
+            thread_name = "%s_%d" % (self._thread_name_prefix or self, num_threads)
+            t = threading.Thread(
+                name=thread_name,
+                target=_futures_thread._worker,
+                args=(
+                    weakref.ref(self, weakref_cb),
+                    self._work_queue,
+                    self._initializer,
+                    self._initargs,
+                ),
+                daemon=True,
+            )
+            t.start()
+            self._threads.add(t)
 
 
 class QueueWorker(threading.Thread):
@@ -264,16 +430,35 @@ class QueueWorker(threading.Thread):
         self.hide_player = True
         self.auto_claim = True
         self.show_browser_window = bool(app.show_browser_window_var.get())
+        self._pending_logs: list[str] = []
+        self._last_log_flush = 0.0
 
     def stop(self) -> None:
         self.stop_event.set()
 
+    def _log(self, text: str) -> None:
+        # Collect lines locally and ship them as one ui_queue message, instead
+        # of one put/pump round-trip per line.
+        self._pending_logs.append(text)
+        self._flush_logs()
+
+    def _flush_logs(self, *, force: bool = False) -> None:
+        if not self._pending_logs:
+            return
+        now = time.time()
+        if not force and (now - self._last_log_flush) < 0.1:
+            return
+        batch = self._pending_logs
+        self._pending_logs = []
+        self._last_log_flush = now
+        self.app.post_log_batch(batch)
+
     def run(self) -> None:
-        self.app.post_log("Worker: iniciando cola")
+        self._log("Worker: iniciando cola")
         try:
             self._run_loop()
         except Exception:
-            self.app.post_log("Worker: error fatal\n" + traceback.format_exc())
+            self._log("Worker: error fatal\n" + traceback.format_exc())
         finally:
             if self.driver is not None:
                 try:
@@ -281,26 +466,28 @@ class QueueWorker(threading.Thread):
                 except Exception:
                     pass
             self.app.post_worker_stopped()
-            self.app.post_log("Worker: detenido")
+            self._log("Worker: detenido")
+            self._flush_logs(force=True)
 
     def _create_driver(self):
         # Keep watcher fully hidden while the stream is being kept open.
         if self.show_browser_window:
-            self.app.post_log("Modo oculto forzado para el worker (se ignora 'Mostrar navegador del worker').")
+            self._log("Modo oculto forzado para el worker (se ignora 'Mostrar navegador del worker').")
         driver = self.app.browser.create_offscreen_driver(profile_name="watcher-offscreen")
         self.app.browser.prime_session_with_cookies(driver)
         return driver
 
     def _run_loop(self) -> None:
         last_save = 0.0
+        last_saved_state: dict[str, tuple[int, str]] = {}
         while not self.stop_event.is_set():
             item = self.app.get_next_queue_item()
             if item is None:
-                self.app.post_log("Cola vacía o todo completado")
+                self._log("Cola vacía o todo completado")
                 time.sleep(1)
                 break
-            status_upper = str(item.status or "").upper()
-            if item.done or status_upper in {"FINISHED", "EXPIRED"}:
+            status_upper = item.status_upper
+            if item.done or status_upper in _FINAL_STATUSES:
                 final_status = "EXPIRED" if status_upper == "EXPIRED" else "FINISHED"
                 self.app.post_update_item(item.url, status=final_status)
                 time.sleep(0.1)
@@ -314,15 +501,20 @@ class QueueWorker(threading.Thread):
                 self.app.post_retry_campaign_hint(item.campaign_id, item.campaign_name)
                 self.app.post_rotate_item(item.url)
             now = time.time()
-            if now - last_save >= 3:
-                self.app.post_save_config()
+            if now - last_save >= 10:
+                # Only post a save when this item actually moved since the last one.
+                state = (item.elapsed_seconds, item.status)
+                if last_saved_state.get(item.url) != state:
+                    last_saved_state[item.url] = state
+                    self.app.post_save_config()
                 last_save = now
+            self._flush_logs()
 
     def _process_item(self, item: QueueItem) -> str:
         url = item.url
         slug = item.slug
         if self.current_url != url:
-            self.app.post_log(f"Abriendo canal: {url}")
+            self._log(f"Abriendo canal: {url}")
             self.app.post_update_item(url, status="CONNECTING", notes="")
             self.app.browser.open_channel(self.driver, url)
             self.current_url = url
@@ -340,10 +532,10 @@ class QueueWorker(threading.Thread):
             now = time.time()
             if self.app._consume_force_channel_switch(url):
                 self.app.post_update_item(url, status="RETRY", notes="cambio manual de canal")
-                self.app.post_log(f"Cambio manual solicitado: {slug}")
+                self._log(f"Cambio manual solicitado: {slug}")
                 return "retry"
-            status_upper = str(item.status or "").upper()
-            if item.done or status_upper in {"FINISHED", "EXPIRED"}:
+            status_upper = item.status_upper
+            if item.done or status_upper in _FINAL_STATUSES:
                 if status_upper == "EXPIRED":
                     self.app.post_update_item(url, status="EXPIRED", notes="campaña caducada")
                     return "finished"
@@ -357,12 +549,12 @@ class QueueWorker(threading.Thread):
                     live_info = self.app.browser.channel_live_status(self.driver, slug)
                 except Exception as exc:
                     self.app.post_update_item(url, status="RETRY", notes=f"error live check: {exc}")
-                    self.app.post_log(f"Live check error ({slug}): {exc}")
+                    self._log(f"Live check error ({slug}): {exc}")
                     time.sleep(5)
                     return "retry"
                 if not live_info.get("live", False):
                     self.app.post_update_item(url, status="RETRY", notes="offline")
-                    self.app.post_log(f"Canal offline: {slug}")
+                    self._log(f"Canal offline: {slug}")
                     time.sleep(2)
                     return "retry"
                 live_category = live_info.get("category_id")
@@ -370,7 +562,7 @@ class QueueWorker(threading.Thread):
                     self.app.post_update_item(
                         url, status="WRONG_CATEGORY", notes=f"cat {live_category} != {item.category_id}"
                     )
-                    self.app.post_log(
+                    self._log(
                         f"Canal en categoría distinta ({slug}): {live_category} != {item.category_id}"
                     )
                     time.sleep(2)
@@ -384,6 +576,7 @@ class QueueWorker(threading.Thread):
                 next_tick = now + tick_seconds
                 self.app.post_increment_elapsed(url, tick_seconds)
                 self.app.post_update_item(url, status="LIVE")
+            self._flush_logs()
             time.sleep(1)
         self.app.post_update_item(url, status="STOPPED", notes="detenido")
         return "stopped"
@@ -393,11 +586,59 @@ class QueueWorker(threading.Thread):
             return
         try:
             clicked = self.app.browser.best_effort_claim_all(self.driver)
-            self.app.post_log(f"Auto-claim (DOM): {clicked} click(s)")
+            self._log(f"Auto-claim (DOM): {clicked} click(s)")
             if self.current_url:
                 self.app.browser.open_channel(self.driver, self.current_url)
         except Exception as exc:
-            self.app.post_log(f"Auto-claim falló: {exc}")
+            self._log(f"Auto-claim falló: {exc}")
+
+
+class _DesiredChannel(NamedTuple):
+    """Best channel candidate per URL in the auto-queue scan.
+
+    sort_key comes first so a plain sorted() orders candidates without a
+    key function.
+    """
+
+    sort_key: tuple[int, str]
+    campaign: KickCampaign
+    channel: KickChannel
+    live: bool | None
+    viewers: int
+
+
+@dataclass(slots=True)
+class _RewardCardWidgets:
+    """Widget handles for one pooled reward sub-card."""
+
+    frame: ttk.Frame
+    img: ttk.Label
+    name: ttk.Label
+    goal: ttk.Label
+    bar: ttk.Progressbar
+    status: ttk.Label
+    url: str = ""
+
+
+@dataclass(slots=True)
+class _InventoryCardWidgets:
+    """Widget handles for one pooled campaign card in the inventory view."""
+
+    frame: ttk.Frame
+    cover: ttk.Label
+    title: ttk.Label
+    state: ttk.Label
+    status: ttk.Label
+    ends: ttk.Label
+    bar: ttk.Progressbar
+    progress: ttk.Label
+    rewards_grid: ttk.Frame
+    toggle_btn: ttk.Button
+    no_rewards: ttk.Label
+    campaign_id: str = ""
+    cover_url: str = ""
+    cols: int = 0
+    reward_cards: list[_RewardCardWidgets] = field(default_factory=list)
 
 
 class KickMinerApp:
@@ -409,8 +650,12 @@ class KickMinerApp:
         self.ui_queue: queue.Queue[tuple[str, tuple, dict]] = queue.Queue()
         self.worker: QueueWorker | None = None
 
+        self._last_config_digest = b""
+        self._config_lock = threading.Lock()
+        self._tr_cache: dict[tuple[str, str], str] = {}
         self.config = self._load_config()
         self.config.language = "es" if str(self.config.language or "").strip().lower().startswith("es") else "en"
+        self._lang_cached: str = self.config.language
         # Force always-on operational behaviors.
         self.config.hide_player = True
         self.config.auto_claim = True
@@ -418,6 +663,11 @@ class KickMinerApp:
         self.config.auto_refresh_seconds = 15
         self.config.auto_game_mining = True
         self.queue_items: list[QueueItem] = self.config.queue_items
+        # URL -> item index so per-tick lookups don't scan the whole queue;
+        # rebuilt whenever the list is reassigned, maintained on append/pop.
+        self._queue_items_by_url: dict[str, QueueItem] = {
+            item.url: item for item in self.queue_items
+        }
         self.campaigns: list[KickCampaign] = []
         self.progress: list[KickProgressCampaign] = []
         self.campaign_map: dict[str, KickCampaign] = {}
@@ -438,30 +688,88 @@ class KickMinerApp:
         self._inventory_driver = None
         self._reward_thumb_cache: dict[str, ImageTk.PhotoImage] = {}
         self._reward_thumb_pending: set[str] = set()
+        # One small shared pool instead of a thread per thumbnail: bounds the
+        # concurrent fetches and lets HTTP connections be reused.
+        self._thumb_pool = _DaemonThreadPoolExecutor(max_workers=4, thread_name_prefix="thumb")
+        # Shared pool for the one-shot background tasks (login, session
+        # refresh, campaign/progress fetches, cookie import); reuses threads
+        # across clicks instead of spawning a fresh one per action.
+        self._bg_pool = _DaemonThreadPoolExecutor(max_workers=8, thread_name_prefix="bg")
         self._reward_thumb_error_logged: set[str] = set()
         self._reward_thumb_failed: set[str] = set()
         self._reward_thumb_blocked_notice_shown = False
         self._reward_thumb_disk_cache_dir = self.base_dir / "cache" / "reward_thumbs"
         self._reward_thumb_disk_cache_dir.mkdir(parents=True, exist_ok=True)
+        self._thumb_path_cache: dict[str, Path] = {}
+        # One directory scan at startup replaces a Path.exists() syscall per
+        # thumbnail request.
+        try:
+            self._disk_cached_names: set[str] = {p.name for p in self._reward_thumb_disk_cache_dir.iterdir()}
+        except OSError:
+            self._disk_cached_names = set()
         self._reward_card_image_labels: dict[str, tk.Label] = {}
+        self._campaign_expired_cache: dict[str, bool] = {}
+        self._ends_epoch_cache: dict[str, float | None] = {}
+        # Separate revisions so a progress-only update does not force the
+        # campaign-side indexes to rebuild (and vice versa).
+        self._campaigns_rev = 0
+        self._progress_rev = 0
+        self._campaign_pair_cache: tuple[int, tuple[dict, dict]] | None = None
+        self._progress_pair_cache: tuple[int, tuple[dict, dict]] | None = None
+        self._campaigns_by_slug_cache: tuple[int, dict[str, list[KickCampaign]]] | None = None
+        self._reward_summary_cache: tuple[int, dict[str, tuple[int, int, int, KickProgressReward | None]]] = (-1, {})
+        self._campaign_game_keys: dict[str, str] = {}
+        self._game_filter_cache: tuple[int, tuple[bool, frozenset[str]] | None] = (-1, None)
+        # User expand/collapse choices for inventory reward grids, by
+        # campaign id; campaigns without an entry use the size-based default.
+        self._inv_expanded_overrides: dict[str, bool] = {}
         self._campaign_live_probe_token = 0
         self._campaign_channel_by_slug: dict[str, KickChannel] = {}
         self._channel_live_cache: dict[str, tuple[bool | None, int, float]] = {}
-        self._preferred_games_cached: list[str] = self._normalize_preferred_games(self.config.preferred_games)
+        self._preferred_games_norm_cache: tuple[tuple[str, ...], tuple[str, ...]] = ((), ())
+        self._preferred_games_cached: list[str] = self._normalize_preferred_games_cached(self.config.preferred_games)
+        # Bumped by _set_preferred_games; lets _preferred_game_filter answer
+        # from cache without re-touching the list at all.
+        self._pref_games_version = 0
         self._inventory_refresh_pending = False
+        self._last_inv_refresh = 0.0
+        self._config_save_after: str | None = None
+        self._queue_refresh_scheduled = False
+        self._thumb_widget_index: dict[str, list[weakref.ref[ttk.Label]]] = {}
+        self._inv_render_campaigns: list[KickCampaign] = []
+        self._inv_card_pool: list[_InventoryCardWidgets] = []
+        self._inv_header_label: ttk.Label | None = None
+        self._inv_message_label: ttk.Label | None = None
+        self._inv_rendered_range: tuple[int, int] = (0, 0)
+        self._inv_rewards_per_row = 4
+        self._inv_wraplength = 180
+        self._last_canvas_width = 0
+        self._scroll_steps: dict[tk.Canvas, int] = {}
+        self._scroll_after: str | None = None
         self._settings_games_refresh_pending = False
         self._settings_game_vars: dict[str, tk.BooleanVar] = {}
         self._settings_game_cards: dict[str, tk.Frame] = {}
         self._settings_game_checks: dict[str, tk.Checkbutton] = {}
         self._settings_game_images: dict[str, str] = {}
+        self._settings_game_img_labels: dict[str, tk.Label] = {}
+        self._settings_game_card_styles: dict[str, tuple[str, str, str]] = {}
+        # (columns, game order) of the last laid-out grid; cards are only
+        # re-gridded when this changes.
+        self._settings_game_layout: tuple[int, tuple[str, ...]] | None = None
         self._placeholder_thumb = self._make_placeholder_thumb()
+        self._i18n_widgets: list[tuple[tk.Widget, str]] = []
+        self._language_dirty = True
+        self._queue_tree_snapshot: dict[str, tuple[tuple, tuple]] = {}
 
         self._setup_logging()
         self._build_ui()
         self._refresh_queue_tree()
+        # One-shot catch-up drain for anything dispatched before the
+        # <<UiQueue>> binding existed; later wakeups are event-driven.
         self.root.after(100, self._pump_ui_queue)
         self.root.after(1500, self._auto_refresh_tick)
         self.root.after(900, self._auto_restore_saved_session)
+        self.root.after(300_000, self._prune_live_cache)
 
     def _setup_logging(self) -> None:
         logger.setLevel(logging.INFO)
@@ -470,8 +778,8 @@ class KickMinerApp:
         if not self.config_path.exists():
             return AppConfig()
         try:
-            with self.config_path.open("r", encoding="utf-8") as f:
-                data = json.load(f)
+            raw = self.config_path.read_bytes()
+            data = orjson.loads(raw) if orjson is not None else json.loads(raw.decode("utf-8"))
             if isinstance(data, dict):
                 return AppConfig.from_dict(data)
         except Exception:
@@ -493,66 +801,138 @@ class KickMinerApp:
             lang_raw = str(self.language_var.get() or "en").strip().lower()
             self.config.language = "es" if lang_raw.startswith("es") else "en"
         if getattr(self, "_settings_game_vars", None):
-            self._preferred_games_cached = self._get_selected_games_from_settings()
-        self._preferred_games_cached = self._normalize_preferred_games(self._preferred_games_cached)
+            self._set_preferred_games(self._get_selected_games_from_settings())
+        else:
+            self._set_preferred_games(self._preferred_games_cached)
         self.config.preferred_games = list(self._preferred_games_cached)
-        with self.config_path.open("w", encoding="utf-8") as f:
-            json.dump(self.config.to_dict(), f, ensure_ascii=False, indent=2)
+        self._write_config()
+
+    def save_config_threadsafe(self) -> None:
+        """Serialize and write the current config without touching Tk state.
+
+        Entry point for worker threads: skips the Tk-variable refresh that
+        save_config does on the UI thread.
+        """
+        self.config.queue_items = self.queue_items
+        try:
+            self._write_config()
+        except Exception as exc:
+            logger.warning("Config save failed: %s", exc)
+
+    def _write_config(self) -> None:
+        with self._config_lock:
+            payload = self.config.to_dict()
+            if orjson is not None:
+                buf = orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+            else:
+                buf = json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
+            digest = hashlib.blake2b(buf, digest_size=16).digest()
+            if digest == self._last_config_digest:
+                return
+            # Write to a sibling temp file and os.replace it in, so the config is
+            # never observed half-written even if the app dies mid-save.
+            tmp_path = self.config_path.with_suffix(".json.tmp")
+            fd = os.open(str(tmp_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, buf)
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(str(tmp_path), str(self.config_path))
+            self._last_config_digest = digest
 
     def _make_placeholder_thumb(self) -> ImageTk.PhotoImage:
+        # Checkerboard built as a raw RGB buffer: the pattern repeats every 12
+        # rows, so only 12 distinct rows are rendered instead of touching all
+        # size*size pixels through putpixel.
         size = 92
-        img = Image.new("RGB", (size, size), color=(33, 37, 41))
-        for x in range(size):
-            for y in range(size):
-                if (x + y) % 12 < 6:
-                    img.putpixel((x, y), (45, 52, 58))
+        dark = bytes((33, 37, 41))
+        light = bytes((45, 52, 58))
+        row_cache: dict[int, bytes] = {}
+        buf = bytearray()
+        for y in range(size):
+            phase = y % 12
+            row = row_cache.get(phase)
+            if row is None:
+                row = b"".join(light if (x + y) % 12 < 6 else dark for x in range(size))
+                row_cache[phase] = row
+            buf += row
+        img = Image.frombytes("RGB", (size, size), bytes(buf))
         return ImageTk.PhotoImage(img)
 
     def _lang(self) -> str:
-        if hasattr(self, "language_var"):
-            raw = str(self.language_var.get() or "en").strip().lower()
-        else:
-            raw = str(self.config.language or "en").strip().lower()
-        return "es" if raw.startswith("es") else "en"
+        # Kept in sync by a write trace on language_var; avoids a Tcl
+        # round-trip on every _tr call.
+        return self._lang_cached
+
+    def _sync_lang_cache(self, *_args) -> None:
+        raw = str(self.language_var.get() or "en").strip().lower()
+        self._lang_cached = "es" if raw.startswith("es") else "en"
 
     def _tr(self, text: str) -> str:
         value = str(text or "")
         if not value:
             return value
-        if self._lang() == "en":
-            direct = UI_ES_TO_EN.get(value)
-            if direct is not None:
-                return direct
-            translated = value
-            for es, en in sorted(UI_ES_TO_EN.items(), key=lambda kv: len(kv[0]), reverse=True):
-                if es and es in translated:
-                    translated = translated.replace(es, en)
-            return translated
-        direct = UI_EN_TO_ES.get(value)
-        if direct is not None:
-            return direct
-        translated = value
-        for en, es in sorted(UI_EN_TO_ES.items(), key=lambda kv: len(kv[0]), reverse=True):
-            if en and en in translated:
-                translated = translated.replace(en, es)
-        return translated
+        lang = self._lang()
+        key = (lang, value)
+        cached = self._tr_cache.get(key)
+        if cached is not None:
+            return cached
+        if lang == "en":
+            result = UI_ES_TO_EN.get(value)
+            if result is None:
+                result = _UI_ES_TO_EN_RE.sub(lambda m: UI_ES_TO_EN[m.group(0)], value)
+        else:
+            result = UI_EN_TO_ES.get(value)
+            if result is None:
+                result = _UI_EN_TO_ES_RE.sub(lambda m: UI_EN_TO_ES[m.group(0)], value)
+        if len(self._tr_cache) >= 4096:
+            self._tr_cache.clear()
+        self._tr_cache[key] = result
+        return result
 
     def _tr_format(self, template: str, **kwargs) -> str:
         return self._tr(template).format(**kwargs)
 
-    def _translate_widget_texts(self, widget) -> None:
-        try:
-            current = widget.cget("text")
-            if isinstance(current, str) and current.strip():
-                widget.configure(text=self._tr(current))
-        except Exception:
-            pass
-        for child in widget.winfo_children():
-            self._translate_widget_texts(child)
+    # Whether a widget class supports the `text` option, memoized per class so
+    # text-less widgets (Frame, Canvas, Scrollbar) never hit the TclError path.
+    _TEXT_CAPABLE_CACHE: dict[type, bool] = {}
+
+    def _register_i18n(self, widget):
+        """Track a widget whose static `text` should follow language changes."""
+        cls = type(widget)
+        capable = self._TEXT_CAPABLE_CACHE.get(cls)
+        if capable is None:
+            try:
+                capable = "text" in widget.keys()
+            except Exception:
+                capable = False
+            self._TEXT_CAPABLE_CACHE[cls] = capable
+        if not capable:
+            return widget
+        text = widget.cget("text")
+        if isinstance(text, str) and text.strip():
+            self._i18n_widgets.append((widget, text))
+        return widget
 
     def _apply_language_to_ui(self) -> None:
+        self._language_dirty = False
         self.root.title(self._tr("Kick Drops Miner"))
-        self._translate_widget_texts(self.root)
+        # Only touch registered text-bearing widgets instead of walking the
+        # whole tree; dynamic cards translate themselves at build time.
+        tr = self._tr
+        registered = self._i18n_widgets
+        alive: list[tuple[tk.Widget, str]] = []
+        append = alive.append
+        for entry in registered:
+            widget, original = entry
+            try:
+                widget.configure(text=tr(original))
+            except tk.TclError:
+                continue
+            append(entry)
+        if len(alive) != len(registered):
+            self._i18n_widgets = alive
         if hasattr(self, "notebook"):
             for tab_id in self.notebook.tabs():
                 tab_text = self.notebook.tab(tab_id, "text")
@@ -592,9 +972,11 @@ class KickMinerApp:
         if self._lang() == code:
             return
         self.language_var.set(code)
+        self._tr_cache.clear()
+        self._language_dirty = True
         self.save_config()
         self._apply_language_to_ui()
-        self._refresh_queue_tree()
+        self._schedule_queue_refresh()
         self._refresh_inventory_view()
 
     def _auto_refresh_tick(self) -> None:
@@ -643,7 +1025,17 @@ class KickMinerApp:
     def _on_inventory_canvas_configure(self, event=None) -> None:
         if event is not None and hasattr(self, "inventory_canvas"):
             self.inventory_canvas.itemconfigure(self._inventory_canvas_window, width=event.width)
-            self._schedule_inventory_refresh()
+            if event.width != self._last_canvas_width:
+                self._last_canvas_width = event.width
+                self._update_inventory_layout_metrics(event.width)
+                self._schedule_inventory_refresh()
+
+    def _update_inventory_layout_metrics(self, canvas_width: int) -> None:
+        available_width = max(900, int(canvas_width))
+        info_panel_width = 420
+        reward_area_width = max(420, available_width - info_panel_width - 60)
+        self._inv_rewards_per_row = max(2, min(6, reward_area_width // 220))
+        self._inv_wraplength = max(120, min(220, (reward_area_width // self._inv_rewards_per_row) - 80))
 
     def _is_inventory_widget(self, widget) -> bool:
         while widget is not None:
@@ -690,9 +1082,25 @@ class KickMinerApp:
                 steps = 1
             else:
                 return None
-        canvas.yview_scroll(steps, "units")
+        # Coalesce fast wheel streams: accumulate steps per canvas and apply
+        # them in one yview_scroll on the next idle tick, so a trackpad burst
+        # costs a single relayout instead of one per event.
+        self._scroll_steps[canvas] = self._scroll_steps.get(canvas, 0) + steps
+        if self._scroll_after is None:
+            self._scroll_after = self.root.after_idle(self._apply_scroll_delta)
         return "break"
 
+    def _apply_scroll_delta(self) -> None:
+        self._scroll_after = None
+        pending = self._scroll_steps
+        self._scroll_steps = {}
+        for canvas, steps in pending.items():
+            if steps:
+                try:
+                    canvas.yview_scroll(steps, "units")
+                except tk.TclError:
+                    pass
+
     def _on_settings_games_frame_configure(self, _event=None) -> None:
         if hasattr(self, "settings_games_canvas"):
             self.settings_games_canvas.configure(scrollregion=self.settings_games_canvas.bbox("all"))
@@ -720,9 +1128,14 @@ class KickMinerApp:
 
         def _flush():
             self._inventory_refresh_pending = False
+            self._last_inv_refresh = time.monotonic()
             self._refresh_inventory_view()
 
-        self.root.after(200, _flush)
+        # Coalesce bursts to at most one rebuild per ~100ms: a refresh long
+        # after the previous one runs almost immediately, while back-to-back
+        # requests wait out the remainder of the window.
+        elapsed_ms = int((time.monotonic() - self._last_inv_refresh) * 1000)
+        self.root.after(max(10, 100 - elapsed_ms), _flush)
 
     def _ensure_inventory_styles(self) -> None:
         if getattr(self, "_inventory_styles_ready", False):
@@ -738,25 +1151,53 @@ class KickMinerApp:
             pass
         self._inventory_styles_ready = True
 
+    # Estimated vertical pitch (card height + pady) used to size the spacer
+    # frames that stand in for off-screen campaign cards.
+    _INV_CARD_PITCH = 190
+
+    def _ensure_inventory_scaffold(self) -> None:
+        # Header, empty-state message and the two virtualization spacers are
+        # created once and reused across refreshes; only one of header/message
+        # occupies row 0 at a time.
+        if self._inv_header_label is not None:
+            return
+        self.inventory_frame.columnconfigure(0, weight=1)
+        self._inv_header_label = ttk.Label(self.inventory_frame)
+        self._inv_header_label.grid(row=0, column=0, sticky="w", padx=8, pady=(2, 6))
+        self._inv_message_label = ttk.Label(self.inventory_frame)
+        self._inv_message_label.grid(row=0, column=0, sticky="ew", padx=12, pady=12)
+        self._inv_message_label.grid_remove()
+        self._inv_top_spacer = tk.Frame(self.inventory_frame, height=0, width=1)
+        self._inv_top_spacer.grid(row=1, column=0)
+        self._inv_bottom_spacer = tk.Frame(self.inventory_frame, height=0, width=1)
+        self._inv_bottom_spacer.grid(row=2, column=0)
+
+    def _show_inventory_message(self, text: str) -> None:
+        self._inv_header_label.grid_remove()
+        self._inv_top_spacer.grid_remove()
+        self._inv_bottom_spacer.grid_remove()
+        for entry in self._inv_card_pool:
+            entry.frame.grid_remove()
+        self._inv_message_label.configure(text=text)
+        self._inv_message_label.grid()
+
     def _refresh_inventory_view(self) -> None:
         if not hasattr(self, "inventory_frame"):
             return
         self._ensure_inventory_styles()
-        for child in self.inventory_frame.winfo_children():
-            child.destroy()
-        self.inventory_frame.columnconfigure(0, weight=1)
+        self._ensure_inventory_scaffold()
+        self._inv_rendered_range = (0, 0)
+        self._inv_render_campaigns = []
+        self._thumb_widget_index.clear()
         if not self.campaigns:
-            ttk.Label(
-                self.inventory_frame,
-                text=self._tr("No hay campanas cargadas todavia. Pulsa 'Actualizar'."),
-            ).grid(row=0, column=0, sticky="ew", padx=12, pady=12)
+            self._show_inventory_message(self._tr("No hay campanas cargadas todavia. Pulsa 'Actualizar'."))
             return
 
         mine_all, selected_games = self._preferred_game_filter()
         visible_campaigns = list(self.campaigns) if mine_all else [
             campaign
             for campaign in self.campaigns
-            if (campaign.game or "").strip().casefold() in selected_games
+            if self._campaign_game_key(campaign) in selected_games
         ]
 
         if not visible_campaigns:
@@ -766,140 +1207,285 @@ class KickMinerApp:
                 msg = self._tr("No hay campañas de los juegos seleccionados.")
             else:
                 msg = self._tr("No hay juegos seleccionados. Marca un juego o 'Todos' en Configuración.")
-            ttk.Label(self.inventory_frame, text=msg).grid(row=0, column=0, sticky="ew", padx=12, pady=12)
+            self._show_inventory_message(msg)
             return
 
         total_rewards = sum(len(campaign.rewards) for campaign in visible_campaigns)
-        ttk.Label(
-            self.inventory_frame,
-            text=f"{len(visible_campaigns)} {self._tr('Campañas').lower()} | {total_rewards} drops",
-        ).grid(row=0, column=0, sticky="w", padx=8, pady=(2, 6))
-
-        available_width = 1200
+        self._inv_message_label.grid_remove()
+        self._inv_header_label.configure(
+            text=f"{len(visible_campaigns)} {self._tr('Campañas').lower()} | {total_rewards} drops"
+        )
+        self._inv_header_label.grid()
+
+        # Layout metrics (_inv_rewards_per_row/_inv_wraplength) are maintained
+        # by _on_inventory_canvas_configure when the canvas width actually
+        # changes, not recomputed per refresh.
+
+        # Only the cards inside (or just outside) the viewport get real
+        # widgets; everything above and below is represented by two spacer
+        # frames so the scrollbar still spans the full list.
+        self._inv_render_campaigns = visible_campaigns
+        self._inv_top_spacer.grid()
+        self._inv_bottom_spacer.grid(row=2 + len(visible_campaigns), column=0)
+        self._render_visible_inventory_cards(force=True)
+        # Static-widget retranslation only needs to run again after an actual
+        # language switch; inventory cards translate themselves at build time.
+        if self._language_dirty:
+            self._apply_language_to_ui()
+
+    def _render_visible_inventory_cards(self, *, force: bool = False) -> None:
+        campaigns = self._inv_render_campaigns
+        if not campaigns:
+            return
+        total = len(campaigns)
         try:
-            available_width = max(900, int(self.inventory_canvas.winfo_width()))
+            top_frac, bottom_frac = self.inventory_canvas.yview()
         except Exception:
-            pass
-        info_panel_width = 420
-        reward_area_width = max(420, available_width - info_panel_width - 60)
-        rewards_per_row = max(2, min(6, reward_area_width // 220))
-
-        for row_idx, campaign in enumerate(visible_campaigns, start=1):
-            is_expired = self._is_campaign_expired(campaign)
-            frame_style = "InventoryNormal.TFrame"
-            label_style = "InventoryNormal.TLabel"
-            campaign_state = "expired" if is_expired else "available"
-            campaign_state_color = "#c0392b" if is_expired else "#1f8f4a"
-
-            card = ttk.Frame(self.inventory_frame, padding=10, relief="ridge", style=frame_style)
-            card.grid(row=row_idx, column=0, sticky="ew", padx=6, pady=(0, 8))
-            card.columnconfigure(0, weight=0)
-            card.columnconfigure(2, weight=1)
-
-            info_panel = ttk.Frame(card, style=frame_style)
-            info_panel.grid(row=0, column=0, sticky="nw", padx=(0, 10))
-            info_panel.columnconfigure(1, weight=1)
-
-            cover_url = self._effective_reward_image_url(None, campaign.game_image)
-            cover_img = self._get_reward_thumb(cover_url)
-            cover = ttk.Label(info_panel, image=cover_img, style=label_style)
-            cover.image = cover_img
-            cover.grid(row=0, column=0, rowspan=6, sticky="nw", padx=(0, 10))
-            if cover_url:
-                self._request_reward_thumb(cover_url)
-
-            status_raw = (campaign.progress_status or campaign.status or "-").replace("_", " ").strip()
-            status = status_raw.title() if status_raw else "-"
-            max_units = max(0, int(campaign.max_required_minutes))
-            if max_units > 0:
-                campaign_percent = int(max(0, min(100, round((campaign.progress_units / max_units) * 100))))
-                progress_text = f"{campaign.progress_units}/{max_units} min"
-            else:
-                campaign_percent = int(
-                    max(
-                        0,
-                        min(
-                            100,
-                            round((sum(r.progress for r in campaign.rewards) * 100.0) / max(1, len(campaign.rewards))),
-                        ),
-                    )
-                )
-                progress_text = f"{campaign.progress_units} min"
+            top_frac, bottom_frac = 0.0, 1.0
+        start = max(0, int(total * top_frac) - 1)
+        end = min(total, int(total * bottom_frac) + 2)
+        if not force and (start, end) == self._inv_rendered_range:
+            return
 
-            ttk.Label(info_panel, text=f"{campaign.game} | {campaign.name}", style=label_style).grid(row=0, column=1, sticky="w")
-            ttk.Label(
-                info_panel,
-                text=self._tr(f"{campaign_state}"),
-                style=label_style,
-                foreground=campaign_state_color,
-            ).grid(row=1, column=1, sticky="w", pady=(2, 0))
-            status_text = (
-                f"{self._tr('Estado')}: {status} | "
-                f"{self._tr('Canales')}: {len(campaign.channels)} | Drops: {len(campaign.rewards)}"
+        self._inv_top_spacer.configure(height=start * self._INV_CARD_PITCH)
+        self._inv_bottom_spacer.configure(height=(total - end) * self._INV_CARD_PITCH)
+        # Cards come from a reusable pool: entries are re-filled via configure
+        # calls rather than destroyed and recreated, and surplus entries are
+        # grid_remove'd so their widgets survive for the next render.
+        # Rewards without their own image all resolve to the campaign cover,
+        # so collect the distinct URLs for the whole render pass and request
+        # each once.
+        pool = self._inv_card_pool
+        needed = end - start
+        pending_urls: set[str] = set()
+        self._thumb_widget_index.clear()
+        for offset in range(needed):
+            if offset == len(pool):
+                pool.append(self._create_inventory_card_widgets())
+            entry = pool[offset]
+            self._populate_inventory_card(entry, campaigns[start + offset], pending_urls)
+            entry.frame.grid(row=2 + start + offset, column=0, sticky="ew", padx=6, pady=(0, 8))
+        for entry in pool[needed:]:
+            entry.frame.grid_remove()
+        self._inv_rendered_range = (start, end)
+        for url in pending_urls:
+            self._request_reward_thumb(url)
+
+    def _on_inventory_yscroll(self, first: str, last: str) -> None:
+        self._inventory_scrollbar.set(first, last)
+        self._render_visible_inventory_cards()
+
+    @staticmethod
+    def _inv_rewards_expanded_default(campaign: KickCampaign) -> bool:
+        rewards = campaign.rewards
+        if not rewards or len(rewards) > 6:
+            return False
+        return not all(r.claimed for r in rewards)
+
+    def _toggle_inventory_rewards(self, campaign: KickCampaign) -> None:
+        current = self._inv_expanded_overrides.get(
+            campaign.id, self._inv_rewards_expanded_default(campaign)
+        )
+        self._inv_expanded_overrides[campaign.id] = not current
+        # Re-fill only this campaign's rewards area; the rest of the view is
+        # untouched.
+        for entry in self._inv_card_pool:
+            if entry.campaign_id == campaign.id:
+                pending_urls: set[str] = set()
+                self._populate_card_rewards(entry, campaign, pending_urls)
+                for url in pending_urls:
+                    self._request_reward_thumb(url)
+                break
+
+    def _create_inventory_card_widgets(self) -> _InventoryCardWidgets:
+        # Builds the fixed skeleton of a campaign card once; campaign data is
+        # applied afterwards with configure calls in _populate_inventory_card.
+        frame_style = "InventoryNormal.TFrame"
+        label_style = "InventoryNormal.TLabel"
+
+        card = ttk.Frame(self.inventory_frame, padding=10, relief="ridge", style=frame_style)
+        card.columnconfigure(0, weight=0)
+        card.columnconfigure(2, weight=1)
+
+        info_panel = ttk.Frame(card, style=frame_style)
+        info_panel.grid(row=0, column=0, sticky="nw", padx=(0, 10))
+        info_panel.columnconfigure(1, weight=1)
+
+        cover = ttk.Label(info_panel, style=label_style)
+        cover.grid(row=0, column=0, rowspan=6, sticky="nw", padx=(0, 10))
+        title = ttk.Label(info_panel, style=label_style)
+        title.grid(row=0, column=1, sticky="w")
+        state = ttk.Label(info_panel, style=label_style)
+        state.grid(row=1, column=1, sticky="w", pady=(2, 0))
+        status = ttk.Label(info_panel, style=label_style)
+        status.grid(row=2, column=1, sticky="w", pady=(2, 0))
+        ends = ttk.Label(info_panel, style=label_style)
+        ends.grid(row=3, column=1, sticky="w", pady=(2, 0))
+        bar = ttk.Progressbar(info_panel, mode="determinate", maximum=100)
+        bar.grid(row=4, column=1, sticky="ew", pady=(6, 0))
+        progress = ttk.Label(info_panel, style=label_style)
+        progress.grid(row=5, column=1, sticky="w", pady=(2, 0))
+
+        ttk.Separator(card, orient="vertical").grid(row=0, column=1, sticky="ns", padx=(0, 8))
+
+        rewards_grid = ttk.Frame(card, style=frame_style)
+        rewards_grid.grid(row=0, column=2, sticky="ew")
+        toggle_btn = ttk.Button(rewards_grid)
+        no_rewards = ttk.Label(rewards_grid, style=label_style)
+
+        return _InventoryCardWidgets(
+            frame=card,
+            cover=cover,
+            title=title,
+            state=state,
+            status=status,
+            ends=ends,
+            bar=bar,
+            progress=progress,
+            rewards_grid=rewards_grid,
+            toggle_btn=toggle_btn,
+            no_rewards=no_rewards,
+        )
+
+    def _create_reward_card_widgets(self, rewards_grid: ttk.Frame) -> _RewardCardWidgets:
+        frame_style = "InventoryNormal.TFrame"
+        label_style = "InventoryNormal.TLabel"
+        frame = ttk.Frame(rewards_grid, padding=8, relief="groove", style=frame_style)
+        frame.columnconfigure(1, weight=1)
+        img = ttk.Label(frame, style=label_style)
+        img.grid(row=0, column=0, rowspan=4, sticky="nw", padx=(0, 8))
+        name = ttk.Label(frame, justify=tk.LEFT, style=label_style)
+        name.grid(row=0, column=1, sticky="w")
+        goal = ttk.Label(frame, style=label_style)
+        goal.grid(row=1, column=1, sticky="w", pady=(2, 0))
+        bar = ttk.Progressbar(frame, mode="determinate", maximum=100)
+        bar.grid(row=2, column=1, sticky="ew", pady=(4, 0))
+        status = ttk.Label(frame, style=label_style)
+        status.grid(row=3, column=1, sticky="w", pady=(4, 0))
+        return _RewardCardWidgets(frame=frame, img=img, name=name, goal=goal, bar=bar, status=status)
+
+    def _populate_inventory_card(
+        self,
+        entry: _InventoryCardWidgets,
+        campaign: KickCampaign,
+        pending_urls: set[str],
+    ) -> None:
+        tr = self._tr
+        entry.campaign_id = campaign.id
+        is_expired = self._is_campaign_expired(campaign)
+
+        cover_url = self._effective_reward_image_url(None, campaign.game_image)
+        cover_img = self._get_reward_thumb(cover_url)
+        # Reused labels usually still show the right PhotoImage (often the
+        # shared placeholder); only touch Tcl when it actually changed.
+        if getattr(entry.cover, "image", None) is not cover_img:
+            entry.cover.configure(image=cover_img)
+            entry.cover.image = cover_img
+        entry.cover_url = cover_url
+        if cover_url:
+            self._thumb_widget_index.setdefault(cover_url, []).append(weakref.ref(entry.cover))
+            pending_urls.add(cover_url)
+
+        status_raw = (campaign.progress_status or campaign.status or "-").replace("_", " ").strip()
+        status = status_raw.title() if status_raw else "-"
+        reward_count = len(campaign.rewards)
+        max_units = max(0, int(campaign.max_required_minutes))
+        if max_units > 0:
+            campaign_percent = int(max(0, min(100, round((campaign.progress_units / max_units) * 100))))
+            progress_text = f"{campaign.progress_units}/{max_units} min"
+        else:
+            progress_sum = sum(r.progress for r in campaign.rewards)
+            campaign_percent = int(
+                max(0, min(100, round((progress_sum * 100.0) / max(1, reward_count))))
             )
-            ttk.Label(
-                info_panel,
-                text=status_text,
-                style=label_style,
-            ).grid(row=2, column=1, sticky="w", pady=(2, 0))
-            ttk.Label(
-                info_panel,
-                text=f"{self._tr('Finaliza')}: {campaign.ends_at or '-'}",
-                style=label_style,
-            ).grid(row=3, column=1, sticky="w", pady=(2, 0))
-            bar = ttk.Progressbar(info_panel, mode="determinate", maximum=100, value=campaign_percent)
-            bar.grid(row=4, column=1, sticky="ew", pady=(6, 0))
-            ttk.Label(
-                info_panel,
-                text=f"{self._tr('Progreso campana')}: {campaign_percent}% ({progress_text})",
-                style=label_style,
-            ).grid(
-                row=5, column=1, sticky="w", pady=(2, 0)
+            progress_text = f"{campaign.progress_units} min"
+
+        entry.title.configure(text=f"{campaign.game} | {campaign.name}")
+        entry.state.configure(
+            text=tr("expired" if is_expired else "available"),
+            foreground="#c0392b" if is_expired else "#1f8f4a",
+        )
+        entry.status.configure(
+            text=(
+                f"{tr('Estado')}: {status} | "
+                f"{tr('Canales')}: {len(campaign.channels)} | Drops: {reward_count}"
             )
+        )
+        entry.ends.configure(text=f"{tr('Finaliza')}: {campaign.ends_at or '-'}")
+        entry.bar.configure(value=campaign_percent)
+        entry.progress.configure(text=f"{tr('Progreso campana')}: {campaign_percent}% ({progress_text})")
 
-            ttk.Separator(card, orient="vertical").grid(row=0, column=1, sticky="ns", padx=(0, 8))
+        self._populate_card_rewards(entry, campaign, pending_urls)
 
-            rewards_grid = ttk.Frame(card, style=frame_style)
-            rewards_grid.grid(row=0, column=2, sticky="ew")
-            for col in range(rewards_per_row):
-                rewards_grid.columnconfigure(col, weight=1, uniform=f"reward-{row_idx}")
+    def _populate_card_rewards(
+        self,
+        entry: _InventoryCardWidgets,
+        campaign: KickCampaign,
+        pending_urls: set[str],
+    ) -> None:
+        tr = self._tr
+        cols = self._inv_rewards_per_row
+        if entry.cols != cols:
+            # uniform only needs to match within one grid container, so a
+            # single shared group name works for every card.
+            for col in range(cols):
+                entry.rewards_grid.columnconfigure(col, weight=1, uniform="reward-cols")
+            entry.cols = cols
+
+        reward_count = len(campaign.rewards)
+        if not reward_count:
+            entry.toggle_btn.grid_remove()
+            for rc in entry.reward_cards:
+                rc.frame.grid_remove()
+            entry.no_rewards.configure(text=tr("Sin drops en esta campana."))
+            entry.no_rewards.grid(row=0, column=0, sticky="w", padx=4, pady=4)
+            return
+        entry.no_rewards.grid_remove()
 
-            if not campaign.rewards:
-                ttk.Label(rewards_grid, text=self._tr("Sin drops en esta campana."), style=label_style).grid(
-                    row=0, column=0, sticky="w", padx=4, pady=4
-                )
-                continue
+        # Reward sub-cards are by far the widget-heaviest part of a campaign
+        # card, so collapsed campaigns only show the toggle button.
+        expanded = self._inv_expanded_overrides.get(
+            campaign.id, self._inv_rewards_expanded_default(campaign)
+        )
+        toggle_label = tr("Ocultar drops") if expanded else tr("Ver drops")
+        entry.toggle_btn.configure(
+            text=f"{'▼' if expanded else '▶'} {toggle_label}",
+            command=lambda c=campaign: self._toggle_inventory_rewards(c),
+        )
+        entry.toggle_btn.grid(row=0, column=0, columnspan=cols, sticky="w", padx=4, pady=(0, 4))
+        if not expanded:
+            for rc in entry.reward_cards:
+                rc.frame.grid_remove()
+            return
 
-            wraplength = max(120, min(220, (reward_area_width // rewards_per_row) - 80))
-            for idx, reward in enumerate(campaign.rewards):
-                reward_row = idx // rewards_per_row
-                reward_col = idx % rewards_per_row
-                reward_card = ttk.Frame(rewards_grid, padding=8, relief="groove", style=frame_style)
-                reward_card.grid(row=reward_row, column=reward_col, sticky="nsew", padx=4, pady=4)
-                reward_card.columnconfigure(1, weight=1)
-
-                img_url = self._effective_reward_image_url(reward.image_url, campaign.game_image)
-                reward_img = self._get_reward_thumb(img_url)
-                img = ttk.Label(reward_card, image=reward_img, style=label_style)
-                img.image = reward_img
-                img.grid(row=0, column=0, rowspan=4, sticky="nw", padx=(0, 8))
-                if img_url:
-                    self._request_reward_thumb(img_url)
-
-                reward_percent = int(max(0, min(100, round(float(reward.progress) * 100.0))))
-                ttk.Label(reward_card, text=reward.name, wraplength=wraplength, justify=tk.LEFT, style=label_style).grid(
-                    row=0, column=1, sticky="w"
-                )
-                goal_text = f"{self._tr('Objetivo')}: {int(reward.required_units or 0)} min"
-                ttk.Label(reward_card, text=goal_text, style=label_style).grid(row=1, column=1, sticky="w", pady=(2, 0))
-                reward_bar = ttk.Progressbar(reward_card, mode="determinate", maximum=100, value=reward_percent)
-                reward_bar.grid(row=2, column=1, sticky="ew", pady=(4, 0))
-                ttk.Label(
-                    reward_card,
-                    text=f"{reward_percent}% | {self._tr('Reclamado') if reward.claimed else self._tr('Pendiente')}",
-                    style=label_style,
-                ).grid(row=3, column=1, sticky="w", pady=(4, 0))
-        self._apply_language_to_ui()
+        wraplength = self._inv_wraplength
+        t_objetivo = tr("Objetivo")
+        t_reclamado = tr("Reclamado")
+        t_pendiente = tr("Pendiente")
+        reward_cards = entry.reward_cards
+        for idx, reward in enumerate(campaign.rewards):
+            if idx == len(reward_cards):
+                reward_cards.append(self._create_reward_card_widgets(entry.rewards_grid))
+            rc = reward_cards[idx]
+
+            img_url = self._effective_reward_image_url(reward.image_url, campaign.game_image)
+            reward_img = self._get_reward_thumb(img_url)
+            if getattr(rc.img, "image", None) is not reward_img:
+                rc.img.configure(image=reward_img)
+                rc.img.image = reward_img
+            rc.url = img_url
+            if img_url:
+                self._thumb_widget_index.setdefault(img_url, []).append(weakref.ref(rc.img))
+                pending_urls.add(img_url)
+
+            reward_percent = int(max(0, min(100, round(float(reward.progress) * 100.0))))
+            rc.name.configure(text=reward.name, wraplength=wraplength)
+            rc.goal.configure(text=f"{t_objetivo}: {int(reward.required_units or 0)} min")
+            rc.bar.configure(value=reward_percent)
+            rc.status.configure(text=f"{reward_percent}% | {t_reclamado if reward.claimed else t_pendiente}")
+            rc.frame.grid(row=1 + idx // cols, column=idx % cols, sticky="nsew", padx=4, pady=4)
+        for rc in reward_cards[reward_count:]:
+            rc.frame.grid_remove()
 
 
     def _get_reward_thumb(self, url: str | None) -> ImageTk.PhotoImage:
@@ -908,20 +1494,26 @@ class KickMinerApp:
         return self._reward_thumb_cache.get(url, self._placeholder_thumb)
 
     @staticmethod
+    @functools.lru_cache(maxsize=2048)
     def _reward_thumb_candidates(url: str) -> list[str]:
+        # Callers treat the returned list as read-only, so the lru_cache'd
+        # instance can be shared.
         raw = str(url or "").strip()
         if not raw:
             return []
-        parsed = urlparse(raw)
-        if parsed.scheme in {"http", "https"}:
+        m = _THUMB_URL_RE.match(raw)
+        if m is not None:
             out = [raw]
-            p = parsed.path.lstrip("/")
-            if "drops/reward-image/" in p and "ext.cdn.kick.com" not in (parsed.netloc or ""):
+            netloc = m.group(2)
+            p = m.group(3).lstrip("/")
+            if "drops/reward-image/" in p and "ext.cdn.kick.com" not in netloc:
                 out.insert(0, f"https://ext.cdn.kick.com/{p}?width=256,format=webp,quality=75")
             return out
         if raw.startswith("//"):
             return [f"https:{raw}"]
         clean = raw.lstrip("/")
+        if clean.startswith(("http://", "https://")):
+            return [clean]
         out = [
             f"https://ext.cdn.kick.com/{clean}?width=256,format=webp,quality=75",
             urljoin("https://ext.cdn.kick.com/", clean),
@@ -929,15 +1521,27 @@ class KickMinerApp:
             urljoin("https://files.kick.com/", clean),
             urljoin("https://kick.com/", clean),
         ]
+        seen: set[str] = set()
         dedup: list[str] = []
         for item in out:
-            if item not in dedup:
-                dedup.append(item)
+            if item in seen:
+                continue
+            seen.add(item)
+            dedup.append(item)
         return dedup
 
     def _reward_thumb_cache_path(self, url: str) -> Path:
-        key = hashlib.sha1(url.encode("utf-8", errors="ignore")).hexdigest()
-        return self._reward_thumb_disk_cache_dir / f"{key}.png"
+        # The URL set is bounded by campaigns x rewards, so memoizing the path
+        # avoids re-hashing the same URLs on every refresh; BLAKE2b beats SHA-1
+        # for a filename key that needs no cryptographic strength.
+        path = self._thumb_path_cache.get(url)
+        if path is None:
+            key = hashlib.blake2b(url.encode("utf-8", errors="ignore"), digest_size=16).hexdigest()
+            # .thumb.png marks files written pre-sized; legacy full-size .png
+            # entries are simply ignored and re-fetched once.
+            path = self._reward_thumb_disk_cache_dir / f"{key}.thumb.png"
+            self._thumb_path_cache[url] = path
+        return path
 
     def _request_reward_thumb(self, url: str | None) -> None:
         if (
@@ -947,39 +1551,63 @@ class KickMinerApp:
             or url in self._reward_thumb_pending
         ):
             return
-        cache_path = self._reward_thumb_cache_path(url)
-        if cache_path.exists():
-            try:
-                data = cache_path.read_bytes()
-                if data:
-                    self._dispatch("_ui_reward_thumb_loaded", url, data, None)
-                    return
-            except Exception:
-                pass
         self._reward_thumb_pending.add(url)
+        cache_path = self._reward_thumb_cache_path(url)
 
         def task():
-            err: str | None = None
+            # Fetch, decode and resize all happen here; the UI thread only
+            # wraps the finished RGB buffer in a PhotoImage.
+            if cache_path.name in self._disk_cached_names:
+                # .thumb.png files are pre-sized RGB thumbnails: no resize
+                # and normally no mode conversion, just the PNG decode.
+                try:
+                    pil = Image.open(cache_path)
+                    if pil.mode != "RGB":
+                        pil = pil.convert("RGB")
+                    self._dispatch("_ui_reward_thumb_decoded", url, pil.tobytes(), pil.size, None)
+                    return
+                except Exception:
+                    pass
             data: bytes | None = None
             last_err = "unknown error"
-            candidates = self._reward_thumb_candidates(url)
-            for candidate in candidates:
+            for candidate in self._reward_thumb_candidates(url):
                 try:
                     data = self.browser.fetch_image_bytes_fast(candidate, timeout_seconds=8.0)
-                    err = None
                     break
                 except Exception as exc:
                     last_err = str(exc)
                     continue
             if data is None:
-                err = last_err
-            self._dispatch("_ui_reward_thumb_loaded", url, data, err)
+                self._dispatch("_ui_reward_thumb_decoded", url, None, (0, 0), last_err)
+                return
+            try:
+                pil = Image.open(io.BytesIO(data)).convert("RGB")
+                pil.thumbnail((92, 92))
+                raw = pil.tobytes()
+                size = pil.size
+            except Exception as exc:
+                self._dispatch("_ui_reward_thumb_decoded", url, None, (0, 0), f"decode: {exc}")
+                return
+            # Persist the already-resized thumbnail, so the next cold start
+            # decodes a tiny PNG instead of the original download.
+            try:
+                pil.save(cache_path, format="PNG")
+                self._disk_cached_names.add(cache_path.name)
+            except Exception:
+                pass
+            self._dispatch("_ui_reward_thumb_decoded", url, raw, size, None)
 
-        threading.Thread(target=task, daemon=True).start()
+        self._thumb_pool.submit(task)
 
-    def _ui_reward_thumb_loaded(self, url: str, data: bytes | None, err: str | None) -> None:
+    def _ui_reward_thumb_decoded(
+        self,
+        url: str,
+        raw: bytes | None,
+        size: tuple[int, int],
+        err: str | None,
+    ) -> None:
         self._reward_thumb_pending.discard(url)
-        if data is None:
+        if raw is None:
             if err and url not in self._reward_thumb_error_logged:
                 err_l = err.lower()
                 if "403" in err_l or "access denied" in err_l or "security policy" in err_l:
@@ -994,22 +1622,30 @@ class KickMinerApp:
                     self._ui_log(f"Miniatura reward no disponible: {err}")
             return
         try:
-            img = Image.open(io.BytesIO(data)).convert("RGB")
-            img.thumbnail((92, 92))
-            photo = ImageTk.PhotoImage(img)
+            photo = ImageTk.PhotoImage(Image.frombytes("RGB", size, raw))
         except Exception as exc:
             self._ui_log(f"Error procesando miniatura: {exc}")
             return
-        try:
-            cache_path = self._reward_thumb_cache_path(url)
-            if not cache_path.exists():
-                cache_path.write_bytes(data)
-        except Exception:
-            pass
         self._reward_thumb_cache[url] = photo
-        # Re-render selected campaign to swap placeholders with real thumbnails.
-        self._refresh_campaign_detail(self._selected_campaign())
-        self._schedule_inventory_refresh()
+        # Swap the image in-place on every label showing this URL instead of
+        # rebuilding the whole inventory per completed thumbnail.
+        refs = self._thumb_widget_index.get(url)
+        if refs:
+            alive: list[weakref.ref[ttk.Label]] = []
+            for ref in refs:
+                label = ref()
+                if label is None:
+                    continue
+                try:
+                    label.configure(image=photo)
+                    label.image = photo
+                except tk.TclError:
+                    continue
+                alive.append(ref)
+            if alive:
+                self._thumb_widget_index[url] = alive
+            else:
+                del self._thumb_widget_index[url]
         self._schedule_settings_games_refresh()
 
     def _build_ui(self) -> None:
@@ -1017,6 +1653,7 @@ class KickMinerApp:
         self.root.geometry("1280x820")
         self.root.minsize(1040, 680)
         self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        self.root.bind("<<UiQueue>>", self._on_ui_queue_event)
 
         self.hide_player_var = tk.BooleanVar(value=True)
         self.auto_claim_var = tk.BooleanVar(value=True)
@@ -1026,6 +1663,7 @@ class KickMinerApp:
         self.auto_refresh_progress_var = tk.BooleanVar(value=True)
         self.auto_refresh_seconds_var = tk.IntVar(value=15)
         self.language_var = tk.StringVar(value=self.config.language)
+        self.language_var.trace_add("write", self._sync_lang_cache)
         self.session_status_var = tk.StringVar(value="Sesion: no comprobada")
         self.login_username_var = tk.StringVar(value=self.config.login_username or "")
         self.auto_game_mining_var = tk.BooleanVar(value=True)
@@ -1066,26 +1704,32 @@ class KickMinerApp:
         session_box = ttk.LabelFrame(frame, text="Sesion")
         session_box.grid(row=0, column=0, sticky="ew", pady=(0, 8))
         session_box.columnconfigure(6, weight=1)
+        self._register_i18n(session_box)
 
         self.open_login_btn = ttk.Button(session_box, text="Iniciar sesion", command=self.login_with_credentials)
         self.open_login_btn.grid(row=0, column=0, padx=4, pady=4)
-        ttk.Button(session_box, text="Comprobar sesion", command=self.refresh_session_status).grid(
-            row=0, column=1, padx=4, pady=4
-        )
-        ttk.Button(session_box, text="Actualizar", command=self.refresh_campaigns_and_progress).grid(
-            row=0, column=2, padx=4, pady=4
-        )
+        self._register_i18n(self.open_login_btn)
+        self._register_i18n(
+            ttk.Button(session_box, text="Comprobar sesion", command=self.refresh_session_status)
+        ).grid(row=0, column=1, padx=4, pady=4)
+        self._register_i18n(
+            ttk.Button(session_box, text="Actualizar", command=self.refresh_campaigns_and_progress)
+        ).grid(row=0, column=2, padx=4, pady=4)
         self.auto_login_btn = self.open_login_btn
 
-        ttk.Label(
-            session_box,
-            text="Refresco de progreso: tiempo real (15s) | Player oculto y auto-claim: activos siempre",
+        self._register_i18n(
+            ttk.Label(
+                session_box,
+                text="Refresco de progreso: tiempo real (15s) | Player oculto y auto-claim: activos siempre",
+            )
         ).grid(row=0, column=3, columnspan=4, padx=(12, 4), pady=4, sticky="w")
 
         ttk.Label(session_box, textvariable=self.session_status_var, anchor="w").grid(
             row=1, column=0, columnspan=5, sticky="w", padx=4, pady=(0, 4)
         )
-        ttk.Label(session_box, text="Usuario activo:").grid(row=1, column=5, sticky="e", padx=(4, 2), pady=(0, 4))
+        self._register_i18n(ttk.Label(session_box, text="Usuario activo:")).grid(
+            row=1, column=5, sticky="e", padx=(4, 2), pady=(0, 4)
+        )
         ttk.Label(session_box, textvariable=self.session_user_var, anchor="w").grid(
             row=1, column=6, sticky="w", padx=(0, 4), pady=(0, 4)
         )
@@ -1093,12 +1737,13 @@ class KickMinerApp:
         mining_box = ttk.LabelFrame(frame, text="Minado actual")
         mining_box.grid(row=1, column=0, sticky="ew", pady=(0, 8))
         mining_box.columnconfigure(1, weight=1)
+        self._register_i18n(mining_box)
 
-        ttk.Label(mining_box, text="Canal:").grid(row=0, column=0, padx=4, pady=2, sticky="w")
+        self._register_i18n(ttk.Label(mining_box, text="Canal:")).grid(row=0, column=0, padx=4, pady=2, sticky="w")
         ttk.Label(mining_box, textvariable=self.general_current_channel_var).grid(row=0, column=1, padx=4, pady=2, sticky="w")
-        ttk.Label(mining_box, text="Campaña:").grid(row=1, column=0, padx=4, pady=2, sticky="w")
+        self._register_i18n(ttk.Label(mining_box, text="Campaña:")).grid(row=1, column=0, padx=4, pady=2, sticky="w")
         ttk.Label(mining_box, textvariable=self.general_current_campaign_var).grid(row=1, column=1, padx=4, pady=2, sticky="w")
-        ttk.Label(mining_box, text="Drop actual:").grid(row=2, column=0, padx=4, pady=2, sticky="w")
+        self._register_i18n(ttk.Label(mining_box, text="Drop actual:")).grid(row=2, column=0, padx=4, pady=2, sticky="w")
         ttk.Label(mining_box, textvariable=self.general_current_drop_var).grid(row=2, column=1, padx=4, pady=2, sticky="w")
         self.general_campaign_progress = ttk.Progressbar(mining_box, mode="determinate", maximum=100)
         self.general_campaign_progress.grid(row=3, column=0, columnspan=2, padx=4, pady=(4, 2), sticky="ew")
@@ -1109,10 +1754,14 @@ class KickMinerApp:
         controls = ttk.Frame(frame)
         controls.grid(row=2, column=0, sticky="ew", pady=(0, 8))
         controls.columnconfigure(2, weight=1)
-        ttk.Button(controls, text="Cambiar canal", command=self.change_channel_now).grid(row=0, column=0, padx=2)
-        ttk.Label(
-            controls,
-            text="Tip: selecciona un canal en la tabla y pulsa 'Cambiar canal' para saltar al siguiente.",
+        self._register_i18n(
+            ttk.Button(controls, text="Cambiar canal", command=self.change_channel_now)
+        ).grid(row=0, column=0, padx=2)
+        self._register_i18n(
+            ttk.Label(
+                controls,
+                text="Tip: selecciona un canal en la tabla y pulsa 'Cambiar canal' para saltar al siguiente.",
+            )
         ).grid(row=1, column=0, columnspan=3, sticky="w", padx=2, pady=(6, 0))
 
         columns = (
@@ -1172,6 +1821,7 @@ class KickMinerApp:
         self.queue_menu.add_command(label="Bajar", command=self.move_selected_down)
 
         logs_box = ttk.LabelFrame(frame, text="Logs")
+        self._register_i18n(logs_box)
         logs_box.grid(row=4, column=0, sticky="nsew", pady=(8, 0))
         logs_box.rowconfigure(0, weight=1)
         logs_box.columnconfigure(0, weight=1)
@@ -1188,14 +1838,19 @@ class KickMinerApp:
         top = ttk.Frame(frame)
         top.grid(row=0, column=0, columnspan=2, sticky="ew", pady=(0, 6))
         top.columnconfigure(0, weight=1)
-        ttk.Label(top, text="Campañas y drops visuales").grid(row=0, column=0, sticky="w")
-        ttk.Button(top, text="Actualizar", command=self.refresh_campaigns_and_progress).grid(row=0, column=1, padx=(8, 0))
+        self._register_i18n(ttk.Label(top, text="Campañas y drops visuales")).grid(row=0, column=0, sticky="w")
+        self._register_i18n(
+            ttk.Button(top, text="Actualizar", command=self.refresh_campaigns_and_progress)
+        ).grid(row=0, column=1, padx=(8, 0))
 
         self.inventory_canvas = tk.Canvas(frame, highlightthickness=0)
         self.inventory_canvas.grid(row=1, column=0, sticky="nsew")
         inv_scroll = ttk.Scrollbar(frame, orient="vertical", command=self.inventory_canvas.yview)
         inv_scroll.grid(row=1, column=1, sticky="ns")
-        self.inventory_canvas.configure(yscrollcommand=inv_scroll.set)
+        self._inventory_scrollbar = inv_scroll
+        # Route scroll updates through _on_inventory_yscroll so newly exposed
+        # campaign cards are materialized as the viewport moves.
+        self.inventory_canvas.configure(yscrollcommand=self._on_inventory_yscroll)
 
         self.inventory_frame = ttk.Frame(self.inventory_canvas)
         self._inventory_canvas_window = self.inventory_canvas.create_window((0, 0), window=self.inventory_frame, anchor="nw")
@@ -1216,11 +1871,14 @@ class KickMinerApp:
         header.grid(row=0, column=0, sticky="ew", pady=(0, 8))
         header.columnconfigure(1, weight=1)
         header.columnconfigure(3, weight=0)
-        ttk.Label(
-            header,
-            text="El minado automatico esta siempre activo. Marca juegos concretos o 'Todos'.",
+        self._register_i18n(header)
+        self._register_i18n(
+            ttk.Label(
+                header,
+                text="El minado automatico esta siempre activo. Marca juegos concretos o 'Todos'.",
+            )
         ).grid(row=0, column=0, columnspan=2, sticky="w", padx=8, pady=(6, 2))
-        ttk.Label(header, text="Idioma:").grid(row=1, column=0, sticky="w", padx=8, pady=(0, 6))
+        self._register_i18n(ttk.Label(header, text="Idioma:")).grid(row=1, column=0, sticky="w", padx=8, pady=(0, 6))
         self.language_combo_var = tk.StringVar(value=self._language_code_to_label(self.language_var.get()))
         self.language_combo = ttk.Combobox(
             header,
@@ -1278,20 +1936,38 @@ class KickMinerApp:
             self.browser.close_thumb_fetcher()
         except Exception:
             pass
+        self._thumb_pool.shutdown(wait=False, cancel_futures=True)
+        self._bg_pool.shutdown(wait=False, cancel_futures=True)
         self.save_config()
         self.root.destroy()
 
     def _pump_ui_queue(self) -> None:
+        # Bounded drain: a refresh storm must not monopolize the Tk loop, so
+        # at most 64 callbacks run per tick and a non-empty queue reschedules
+        # via after_idle, letting pending paint/scroll events interleave.
+        drained = 0
         try:
-            while True:
+            for _ in range(64):
                 method, args, kwargs = self.ui_queue.get_nowait()
+                drained += 1
                 getattr(self, method)(*args, **kwargs)
         except queue.Empty:
             pass
-        self.root.after(100, self._pump_ui_queue)
+        if drained == 64:
+            self.root.after_idle(self._pump_ui_queue)
+
+    def _on_ui_queue_event(self, _event=None) -> None:
+        self._pump_ui_queue()
 
     def _dispatch(self, method: str, *args, **kwargs) -> None:
         self.ui_queue.put((method, args, kwargs))
+        # Wake the Tk thread right away instead of waiting for a poll tick;
+        # event_generate is thread-safe on Tcl/Tk 8.6. The root may already be
+        # gone during shutdown, in which case the update is moot anyway.
+        try:
+            self.root.event_generate("<<UiQueue>>", when="tail")
+        except Exception:
+            pass
 
     def _request_force_channel_switch(self, url: str) -> None:
         target = str(url or "").strip()
@@ -1313,6 +1989,9 @@ class KickMinerApp:
     def post_log(self, text: str) -> None:
         self._dispatch("_ui_log", text)
 
+    def post_log_batch(self, lines: list[str]) -> None:
+        self._dispatch("_ui_log_batch", lines)
+
     def post_worker_stopped(self) -> None:
         self._dispatch("_ui_worker_stopped")
 
@@ -1323,7 +2002,9 @@ class KickMinerApp:
         self._dispatch("_ui_increment_elapsed", url, seconds)
 
     def post_save_config(self) -> None:
-        self._dispatch("_ui_save_config")
+        # Worker saves no longer round-trip through the UI queue: the
+        # serialization and disk write happen on the calling thread.
+        self.save_config_threadsafe()
 
     def post_rotate_item(self, url: str) -> None:
         self._dispatch("_ui_rotate_item", url)
@@ -1344,19 +2025,26 @@ class KickMinerApp:
         self.log_text.configure(state="disabled")
         self.status_var.set(localized.splitlines()[0][:180])
 
+    def _ui_log_batch(self, lines: list[str]) -> None:
+        if not lines:
+            return
+        stamp = time.strftime("%H:%M:%S")
+        localized = [self._tr(text) for text in lines]
+        for text in localized:
+            logger.info(text)
+        self.log_text.configure(state="normal")
+        self.log_text.insert(tk.END, "".join(f"[{stamp}] {text}\n" for text in localized))
+        self.log_text.see(tk.END)
+        self.log_text.configure(state="disabled")
+        self.status_var.set(localized[-1].splitlines()[0][:180])
+
     def _ui_worker_stopped(self) -> None:
         self.worker = None
         self.status_var.set(self._tr("Cola detenida"))
-        self._refresh_queue_tree()
+        self._schedule_queue_refresh()
         if not self._shutting_down:
             self.root.after(600, self._ensure_queue_worker_running)
 
-    def _ui_save_config(self) -> None:
-        try:
-            self.save_config()
-        except Exception as exc:
-            self._ui_log(f"Error guardando config: {exc}")
-
     def _ui_update_item(self, url: str, changes: dict[str, object]) -> None:
         item = self._find_item_by_url(url)
         if item is None:
@@ -1365,15 +2053,15 @@ class KickMinerApp:
             setattr(item, k, v)
         if item.done and item.status != "FINISHED":
             item.status = "FINISHED"
-        if item.status in {"FINISHED", "EXPIRED"}:
-            hint_id = str(self._retry_campaign_hint_id or "")
-            hint_name = str(self._retry_campaign_hint_name or "")
-            item_id = str(item.campaign_id or "")
-            item_name = str(item.campaign_name or "").strip().lower()
+        if item.status in _FINAL_STATUSES:
+            hint_id = self._retry_campaign_hint_id or ""
+            hint_name = self._retry_campaign_hint_name or ""
+            item_id = item.campaign_id_key
+            item_name = item.campaign_name_key
             if (hint_id and item_id == hint_id) or (hint_name and item_name == hint_name):
                 self._retry_campaign_hint_id = None
                 self._retry_campaign_hint_name = None
-        self._refresh_queue_tree()
+        self._schedule_queue_refresh()
 
     def _ui_increment_elapsed(self, url: str, seconds: int) -> None:
         item = self._find_item_by_url(url)
@@ -1382,7 +2070,28 @@ class KickMinerApp:
         item.elapsed_seconds += max(1, int(seconds))
         if item.done:
             item.status = "FINISHED"
-        self._refresh_queue_tree()
+            self._schedule_queue_refresh()
+            return
+        # Per-second tick: only this row's time cell moved, so poke it in
+        # place instead of re-diffing the whole table.
+        try:
+            iid = str(self.queue_items.index(item))
+        except ValueError:
+            self._schedule_queue_refresh()
+            return
+        snap = self._queue_tree_snapshot.get(iid)
+        if snap is None:
+            self._schedule_queue_refresh()
+            return
+        progress_text = _fmt_seconds(item.elapsed_seconds)
+        try:
+            self.queue_tree.set(iid, "progress", progress_text)
+        except tk.TclError:
+            self._schedule_queue_refresh()
+            return
+        values, tags = snap
+        self._queue_tree_snapshot[iid] = (values[:4] + (progress_text,) + values[5:], tags)
+        self._schedule_config_save()
 
     def _ui_rotate_item(self, url: str) -> None:
         item = self._find_item_by_url(url)
@@ -1394,11 +2103,13 @@ class KickMinerApp:
             return
         if idx < len(self.queue_items) - 1:
             self.queue_items.append(self.queue_items.pop(idx))
-            self._refresh_queue_tree()
+            self._schedule_queue_refresh()
 
     def _ui_set_retry_campaign_hint(self, campaign_id: str | None, campaign_name: str | None) -> None:
         self._retry_campaign_hint_id = str(campaign_id or "").strip() or None
-        self._retry_campaign_hint_name = str(campaign_name or "").strip().lower() or None
+        # Interned to match the campaign/item name keys, so the hint
+        # comparisons in the picker resolve on identity.
+        self._retry_campaign_hint_name = sys.intern(str(campaign_name or "").strip().lower()) or None
 
     def _ui_set_login_driver(self, driver) -> None:
         previous = getattr(self, "_login_driver", None)
@@ -1456,7 +2167,7 @@ class KickMinerApp:
             self.session_user_var.set("-")
         if state != "checking":
             self._ui_log(f"Estado de sesion: {label}")
-        if state in {"logged_out", "no_session"}:
+        if state in _LOGGED_OUT_STATES:
             self._initial_sync_done = False
         if state == "logged_in" and not self._initial_sync_done:
             self._initial_sync_done = True
@@ -1467,19 +2178,19 @@ class KickMinerApp:
         self._refresh_general_mining_panel()
 
     def _find_item_by_url(self, url: str) -> QueueItem | None:
-        for item in self.queue_items:
-            if item.url == url:
-                return item
-        return None
+        return self._queue_items_by_url.get(url)
 
-    @staticmethod
-    def _is_progress_campaign_finished(progress_campaign: KickProgressCampaign | None) -> bool:
+    def _reindex_queue_items(self) -> None:
+        self._queue_items_by_url = {item.url: item for item in self.queue_items}
+
+    def _is_progress_campaign_finished(self, progress_campaign: KickProgressCampaign | None) -> bool:
         if progress_campaign is None:
             return False
-        if progress_campaign.rewards:
-            return all(bool(reward.claimed) for reward in progress_campaign.rewards)
+        claimed_count, total_rewards, _, _ = self._summarize_rewards(progress_campaign)
+        if total_rewards:
+            return claimed_count == total_rewards
         status = str(progress_campaign.status or "").strip().lower()
-        return status in {"claimed", "completed", "finished", "done"}
+        return status in _FINISHED_PROGRESS_STATUSES
 
     @staticmethod
     def _resolve_item_progress_campaign(
@@ -1491,10 +2202,50 @@ class KickMinerApp:
         if item.campaign_id:
             progress_campaign = progress_by_id.get(item.campaign_id)
         if progress_campaign is None and item.campaign_name:
-            progress_campaign = progress_by_name.get(item.campaign_name.strip().lower())
+            progress_campaign = progress_by_name.get(item.campaign_name_key)
         return progress_campaign
 
+    def _summarize_rewards(
+        self, progress_campaign: KickProgressCampaign
+    ) -> tuple[int, int, int, KickProgressReward | None]:
+        """Single pass over a campaign's rewards.
+
+        Returns (claimed count, total, max percent, active reward) where the
+        active reward is the first unclaimed one, falling back to the last.
+        Cached per campaign until campaigns or progress are replaced.
+        """
+        version, cache = self._reward_summary_cache
+        if version != self._progress_rev:
+            cache = {}
+            self._reward_summary_cache = (self._progress_rev, cache)
+        summary = cache.get(progress_campaign.id)
+        if summary is not None:
+            return summary
+        claimed_count = 0
+        max_percent = 0
+        first_unclaimed: KickProgressReward | None = None
+        last: KickProgressReward | None = None
+        for reward in progress_campaign.rewards:
+            last = reward
+            if reward.claimed:
+                claimed_count += 1
+            elif first_unclaimed is None:
+                first_unclaimed = reward
+            percent = int(reward.progress * 100)
+            if percent > max_percent:
+                max_percent = percent
+        summary = (
+            claimed_count,
+            len(progress_campaign.rewards),
+            max_percent,
+            first_unclaimed if first_unclaimed is not None else last,
+        )
+        if progress_campaign.id:
+            cache[progress_campaign.id] = summary
+        return summary
+
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def _parse_kick_datetime(value: str | None) -> datetime | None:
         raw = str(value or "").strip()
         if not raw:
@@ -1507,49 +2258,108 @@ class KickMinerApp:
             return dt.astimezone(timezone.utc)
         except Exception:
             pass
-        for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M:%S.%f"):
-            try:
-                dt = datetime.strptime(raw, fmt).replace(tzinfo=timezone.utc)
-                return dt
-            except Exception:
-                continue
-        return None
+        # Fallback for strings fromisoformat rejects: pull the fields out
+        # with one regex match instead of trying strptime formats in turn.
+        m = _KICK_DATETIME_RE.match(raw)
+        if m is None:
+            return None
+        year, month, day, hour, minute, second, frac = m.groups()
+        try:
+            return datetime(
+                int(year),
+                int(month),
+                int(day),
+                int(hour),
+                int(minute),
+                int(second),
+                int((frac or "").ljust(6, "0")[:6] or 0),
+                tzinfo=timezone.utc,
+            )
+        except ValueError:
+            return None
+
+    _EXPIRED_TOKENS = frozenset({"expired", "ended", "closed", "past"})
 
-    def _is_campaign_expired(self, campaign: KickCampaign | None) -> bool:
+    def _is_campaign_expired(self, campaign: KickCampaign | None, now: float | None = None) -> bool:
         if campaign is None:
             return False
-        expired_tokens = {"expired", "ended", "closed", "past"}
+        # KickCampaign is a slots dataclass, so the memo lives app-side keyed
+        # by id; it is dropped whenever campaigns or progress are replaced.
+        cached = self._campaign_expired_cache.get(campaign.id)
+        if cached is not None:
+            return cached
+        expired = self._compute_campaign_expired(campaign, now)
+        if campaign.id:
+            self._campaign_expired_cache[campaign.id] = expired
+        return expired
+
+    def _compute_campaign_expired(self, campaign: KickCampaign, now: float | None = None) -> bool:
         status_values = [
             str(campaign.status or "").strip().lower().replace(" ", "_"),
             str(campaign.progress_status or "").strip().lower().replace(" ", "_"),
         ]
-        if any(value in expired_tokens for value in status_values if value):
+        if any(value in self._EXPIRED_TOKENS for value in status_values if value):
             return True
-        ends_at = self._parse_kick_datetime(campaign.ends_at)
-        if ends_at is not None and datetime.now(timezone.utc) >= ends_at:
-            return True
-        return False
+        ends_raw = campaign.ends_at
+        if not ends_raw:
+            return False
+        # strptime is slow; parse each distinct ends_at string once and keep
+        # the epoch (None = unparseable) keyed by the raw string.
+        try:
+            ends_epoch = self._ends_epoch_cache[ends_raw]
+        except KeyError:
+            dt = self._parse_kick_datetime(ends_raw)
+            ends_epoch = dt.timestamp() if dt is not None else None
+            self._ends_epoch_cache[ends_raw] = ends_epoch
+        if ends_epoch is None:
+            return False
+        return (now if now is not None else time.time()) >= ends_epoch
+
+    def _campaign_indexes(self) -> tuple[
+        dict[str, KickCampaign],
+        dict[str, KickCampaign],
+        dict[str, KickProgressCampaign],
+        dict[str, KickProgressCampaign],
+    ]:
+        # The id/name lookup dicts only change when campaigns or progress are
+        # replaced, not on every tick — rebuild each pair once per revision.
+        cached = self._campaign_pair_cache
+        if cached is not None and cached[0] == self._campaigns_rev:
+            campaign_by_id, campaign_by_name = cached[1]
+        else:
+            campaign_by_id = {cid: campaign for campaign in self.campaigns if (cid := campaign.id)}
+            campaign_by_name = {
+                key: campaign for campaign in self.campaigns if (key := campaign.name_key)
+            }
+            self._campaign_pair_cache = (self._campaigns_rev, (campaign_by_id, campaign_by_name))
+        cached = self._progress_pair_cache
+        if cached is not None and cached[0] == self._progress_rev:
+            progress_by_id, progress_by_name = cached[1]
+        else:
+            progress_by_id = {cid: campaign for campaign in self.progress if (cid := campaign.id)}
+            progress_by_name = {
+                key: campaign for campaign in self.progress if (key := campaign.name_key)
+            }
+            self._progress_pair_cache = (self._progress_rev, (progress_by_id, progress_by_name))
+        return (campaign_by_id, campaign_by_name, progress_by_id, progress_by_name)
 
     def _refresh_queue_tree(self) -> None:
-        campaign_by_id = {campaign.id: campaign for campaign in self.campaigns if campaign.id}
-        campaign_by_name = {
-            (campaign.name or "").strip().lower(): campaign
-            for campaign in self.campaigns
-            if (campaign.name or "").strip()
-        }
-        progress_by_id = {campaign.id: campaign for campaign in self.progress if campaign.id}
-        progress_by_name = {
-            (campaign.name or "").strip().lower(): campaign
-            for campaign in self.progress
-            if (campaign.name or "").strip()
-        }
-        for iid in self.queue_tree.get_children():
-            self.queue_tree.delete(iid)
+        campaign_by_id, campaign_by_name, progress_by_id, progress_by_name = self._campaign_indexes()
+        # Diff against the previous render instead of delete+reinsert: Tk then
+        # repaints only rows whose values or tags actually changed, which is
+        # usually a single elapsed/status cell per tick.
+        snapshot = self._queue_tree_snapshot
+        new_snapshot: dict[str, tuple[tuple, tuple]] = {}
+        now = time.time()
+        # Bind the translator and resolve the per-row constant once; the rest
+        # of the _tr calls vary by status and hit the memo dict.
+        tr = self._tr
+        claimed_word = tr("Reclamado").lower()
         for idx, item in enumerate(self.queue_items):
             elapsed = _fmt_seconds(item.elapsed_seconds)
             progress_text = elapsed
             campaign = self._resolve_queue_item_campaign(item, campaign_by_id, campaign_by_name)
-            if self._is_campaign_expired(campaign):
+            if self._is_campaign_expired(campaign, now):
                 item.status = "EXPIRED"
             progress_campaign = self._resolve_item_progress_campaign(item, progress_by_id, progress_by_name)
             if self._is_progress_campaign_finished(progress_campaign):
@@ -1560,6 +2370,7 @@ class KickMinerApp:
                 item.slug,
                 max_age_seconds=120.0,
                 use_network=False,
+                now=now,
             )
             if status_upper == "LIVE":
                 live_state = True
@@ -1580,9 +2391,8 @@ class KickMinerApp:
                 drop_status = progress_campaign.status or "-"
                 drop_units = str(progress_campaign.progress_units)
                 if progress_campaign.rewards:
-                    claimed_count = sum(1 for reward in progress_campaign.rewards if reward.claimed)
-                    max_percent = max(int(reward.progress * 100) for reward in progress_campaign.rewards)
-                    rewards_summary = f"{claimed_count}/{len(progress_campaign.rewards)} {self._tr('Reclamado').lower()} | max {max_percent}%"
+                    claimed_count, total_rewards, max_percent, _ = self._summarize_rewards(progress_campaign)
+                    rewards_summary = f"{claimed_count}/{total_rewards} {claimed_word} | max {max_percent}%"
             if drop_units != "-" and drop_units:
                 if rewards_summary == "-":
                     rewards_summary = f"{drop_units}u"
@@ -1590,32 +2400,57 @@ class KickMinerApp:
                     rewards_summary = f"{rewards_summary} | {drop_units}u"
 
             if drop_status != "-" and drop_status:
-                status_text = f"{self._tr(item.status)} | {self._tr(drop_status)}"
+                status_text = f"{tr(item.status)} | {tr(drop_status)}"
             else:
-                status_text = self._tr(item.status)
-
-            status_tag = item.status if item.status in {
-                "LIVE", "FINISHED", "EXPIRED", "RETRY", "WRONG_CATEGORY", "CONNECTING"
-            } else ""
-            tags: list[str] = [live_tag]
-            if status_tag:
-                tags.insert(0, status_tag)
-            self.queue_tree.insert(
-                "",
-                tk.END,
-                iid=str(idx),
-                values=(
-                    live_dot,
-                    item.slug,
-                    item.campaign_name or "",
-                    viewers_text,
-                    progress_text,
-                    status_text,
-                    rewards_summary,
-                ),
-                tags=tuple(tags),
+                status_text = tr(item.status)
+
+            status_tag = item.status if item.status in _TAGGABLE_STATUSES else ""
+            tags = _queue_row_tags(status_tag, live_tag)
+            iid = str(idx)
+            values = (
+                live_dot,
+                item.slug,
+                item.campaign_name or "",
+                viewers_text,
+                progress_text,
+                status_text,
+                rewards_summary,
             )
+            row = (values, tags)
+            new_snapshot[iid] = row
+            if iid not in snapshot:
+                self.queue_tree.insert("", tk.END, iid=iid, values=row[0], tags=row[1])
+            elif snapshot[iid] != row:
+                self.queue_tree.item(iid, values=row[0], tags=row[1])
+        for iid in snapshot:
+            if iid not in new_snapshot:
+                self.queue_tree.delete(iid)
+        self._queue_tree_snapshot = new_snapshot
         self._refresh_general_mining_panel()
+        self._schedule_config_save()
+
+    def _schedule_queue_refresh(self) -> None:
+        # Mutation paths often touch the queue several times back to back
+        # (set campaigns, then progress, then the inventory view); collapse
+        # those into a single rebuild once the event loop goes idle.
+        if self._queue_refresh_scheduled:
+            return
+        self._queue_refresh_scheduled = True
+        self.root.after_idle(self._do_queue_refresh)
+
+    def _do_queue_refresh(self) -> None:
+        self._queue_refresh_scheduled = False
+        self._refresh_queue_tree()
+
+    def _schedule_config_save(self) -> None:
+        # Queue refreshes fire once per second per active channel; batch the
+        # JSON serialize + disk write down to at most one every two seconds.
+        if self._config_save_after is not None:
+            return
+        self._config_save_after = self.root.after(2000, self._flush_config_save)
+
+    def _flush_config_save(self) -> None:
+        self._config_save_after = None
         self.save_config()
 
     def _refresh_general_mining_panel(self) -> None:
@@ -1624,12 +2459,12 @@ class KickMinerApp:
         current_item: QueueItem | None = None
         if self.worker is not None and self.worker.is_alive():
             for item in self.queue_items:
-                if item.status in {"LIVE", "CONNECTING", "RETRY", "WRONG_CATEGORY"}:
+                if item.status in _ACTIVE_STATUSES:
                     current_item = item
                     break
         if current_item is None:
             for item in self.queue_items:
-                if item.status not in {"FINISHED", "EXPIRED"}:
+                if item.status not in _FINAL_STATUSES:
                     current_item = item
                     break
         if current_item is None:
@@ -1646,23 +2481,18 @@ class KickMinerApp:
         if not hasattr(self, "general_campaign_progress"):
             return
 
-        progress_by_id = {campaign.id: campaign for campaign in self.progress if campaign.id}
-        progress_by_name = {
-            (campaign.name or "").strip().lower(): campaign
-            for campaign in self.progress
-            if (campaign.name or "").strip()
-        }
+        _, _, progress_by_id, progress_by_name = self._campaign_indexes()
         campaign_progress = None
         if current_item.campaign_id:
             campaign_progress = progress_by_id.get(current_item.campaign_id)
         if campaign_progress is None and current_item.campaign_name:
-            campaign_progress = progress_by_name.get(current_item.campaign_name.strip().lower())
+            campaign_progress = progress_by_name.get(current_item.campaign_name_key)
 
         active_drop_name = "-"
         active_drop_pct = 0
         detail = self._tr("Sin datos de drop todavía")
         if campaign_progress is not None and campaign_progress.rewards:
-            reward = next((r for r in campaign_progress.rewards if not r.claimed), campaign_progress.rewards[-1])
+            _, _, _, reward = self._summarize_rewards(campaign_progress)
             active_drop_name = reward.name or reward.id
             active_drop_pct = int(max(0, min(100, reward.progress * 100)))
             required = int(reward.required_units or 0)
@@ -1678,33 +2508,67 @@ class KickMinerApp:
 
     @staticmethod
     def _normalize_preferred_games(values: list[str] | None) -> list[str]:
-        cleaned: list[str] = []
+        # Keep the casefolded key alongside each name so the sort below
+        # compares keys directly instead of re-casefolding per comparison.
+        cleaned: list[tuple[str, str]] = []
         seen: set[str] = set()
         for raw in values or []:
             game = str(raw or "").strip()
             if not game:
                 continue
+            if game == ALL_GAMES_TOKEN:
+                return [ALL_GAMES_TOKEN]
             key = game.casefold()
             if key in seen:
                 continue
             seen.add(key)
-            cleaned.append(game)
-        if any(game == ALL_GAMES_TOKEN for game in cleaned):
-            return [ALL_GAMES_TOKEN]
+            cleaned.append((key, game))
         if cleaned:
-            return sorted(cleaned, key=lambda s: s.casefold())
+            cleaned.sort()
+            return [game for _key, game in cleaned]
         return [ALL_GAMES_TOKEN]
 
-    def _preferred_game_filter(self) -> tuple[bool, set[str]]:
-        normalized = self._normalize_preferred_games(self._preferred_games_cached)
-        self._preferred_games_cached = normalized
+    def _normalize_preferred_games_cached(self, values: list[str] | None) -> list[str]:
+        # The selection rarely changes between saves; reuse the last normalized
+        # result as long as the input snapshot is identical.
+        snapshot = tuple(values or ())
+        cached_input, cached_result = self._preferred_games_norm_cache
+        if snapshot == cached_input:
+            return list(cached_result)
+        result = self._normalize_preferred_games(values)
+        self._preferred_games_norm_cache = (snapshot, tuple(result))
+        return result
+
+    def _set_preferred_games(self, values: list[str] | None) -> None:
+        normalized = self._normalize_preferred_games_cached(values)
+        if normalized != self._preferred_games_cached:
+            self._preferred_games_cached = normalized
+            self._pref_games_version += 1
+
+    def _preferred_game_filter(self) -> tuple[bool, frozenset[str]]:
+        version, cached_result = self._game_filter_cache
+        if version == self._pref_games_version and cached_result is not None:
+            return cached_result
+        normalized = self._preferred_games_cached
         mine_all = ALL_GAMES_TOKEN in normalized
-        selected = {
+        selected = frozenset(
             game.strip().casefold()
             for game in normalized
             if game != ALL_GAMES_TOKEN and game.strip()
-        }
-        return (mine_all, selected)
+        )
+        result = (mine_all, selected)
+        self._game_filter_cache = (self._pref_games_version, result)
+        return result
+
+    def _campaign_game_key(self, campaign: KickCampaign) -> str:
+        # casefold() is not cheap; normalize each campaign's game name once
+        # per campaign list instead of once per filter pass.
+        key = self._campaign_game_keys.get(campaign.id)
+        if key is None:
+            key = (campaign.game or "").strip().casefold()
+            if campaign.id:
+                self._campaign_game_keys[campaign.id] = key
+        return key
 
     def _refresh_settings_count_label(self) -> None:
         if not hasattr(self, "settings_games_count_var"):
@@ -1717,7 +2581,7 @@ class KickMinerApp:
 
     @staticmethod
     def _is_auto_games_channel_item(item: QueueItem) -> bool:
-        return AUTO_GAMES_CHANNEL_SOURCE in str(item.notes or "")
+        return item.is_auto_games
 
     @staticmethod
     def _build_auto_games_item_notes(campaign: KickCampaign, channel: KickChannel, viewers: int) -> str:
@@ -1727,14 +2591,16 @@ class KickMinerApp:
         )
 
     @staticmethod
-    def _channel_live_sort_key(live: bool | None, viewers: int, slug: str) -> tuple[int, int, str]:
+    def _channel_live_sort_key(live: bool | None, viewers: int, slug_key: str) -> tuple[int, str]:
         if live is True:
             rank = 0
         elif live is False:
             rank = 1
         else:
             rank = 2
-        return (rank, -max(0, int(viewers)), str(slug or "").casefold())
+        # Rank and viewers packed into one int: comparisons normally settle
+        # on the number and only fall through to the slug on exact ties.
+        return ((rank << 32) - max(0, int(viewers)), slug_key)
 
     def _get_selected_games_from_settings(self) -> list[str]:
         if not hasattr(self, "_settings_game_vars"):
@@ -1755,12 +2621,17 @@ class KickMinerApp:
         selected = bool(var.get())
         bg = "#d9f7df" if selected else "#f0f0f0"
         fg = "#1f8f4a" if selected else "#1f1f1f"
-        card.configure(bg=bg, highlightbackground="#87c995" if selected else "#cfcfcf")
-        for child in card.winfo_children():
-            try:
-                child.configure(bg=bg)
-            except Exception:
-                pass
+        highlight = "#87c995" if selected else "#cfcfcf"
+        style = (bg, fg, highlight)
+        # configure() is not free even when nothing changes; skip the whole
+        # pass when the card already wears this style.
+        if self._settings_game_card_styles.get(game) == style:
+            return
+        self._settings_game_card_styles[game] = style
+        card.configure(bg=bg, highlightbackground=highlight)
+        img_label = self._settings_game_img_labels.get(game)
+        if img_label is not None:
+            img_label.configure(bg=bg)
         check.configure(bg=bg, activebackground=bg, fg=fg, activeforeground=fg, selectcolor=bg)
 
     def _on_settings_game_toggle(self, game: str) -> None:
@@ -1781,13 +2652,14 @@ class KickMinerApp:
                 all_var.set(False)
                 self._apply_settings_game_card_style(ALL_GAMES_TOKEN)
 
-        self._preferred_games_cached = self._get_selected_games_from_settings()
+        self._set_preferred_games(self._get_selected_games_from_settings())
         self._apply_settings_game_card_style(game)
         self._refresh_settings_count_label()
-        self._apply_language_to_ui()
+        if self._language_dirty:
+            self._apply_language_to_ui()
         self._refresh_inventory_view()
         self._auto_queue_selected_games()
-        self._refresh_queue_tree()
+        self._schedule_queue_refresh()
         self._ensure_queue_worker_running()
         self.save_config()
 
@@ -1795,7 +2667,7 @@ class KickMinerApp:
         if not hasattr(self, "settings_games_frame"):
             return
 
-        self._preferred_games_cached = self._normalize_preferred_games(self._preferred_games_cached)
+        self._set_preferred_games(self._preferred_games_cached)
         selected = set(self._preferred_games_cached)
         discovered: dict[str, str] = {}
         for campaign in self.campaigns:
@@ -1813,11 +2685,19 @@ class KickMinerApp:
         )
         self._settings_game_images = dict(discovered)
 
-        for child in self.settings_games_frame.winfo_children():
-            child.destroy()
-        self._settings_game_vars = {}
-        self._settings_game_cards = {}
-        self._settings_game_checks = {}
+        # Reuse existing cards: destroying and rebuilding every widget on a
+        # toggle flickers and is by far the slowest part of this refresh.
+        current_games = set(all_games)
+        for game in [g for g in self._settings_game_cards if g not in current_games]:
+            card = self._settings_game_cards.pop(game)
+            self._settings_game_vars.pop(game, None)
+            self._settings_game_checks.pop(game, None)
+            self._settings_game_img_labels.pop(game, None)
+            self._settings_game_card_styles.pop(game, None)
+            try:
+                card.destroy()
+            except tk.TclError:
+                pass
 
         canvas_width = 980
         try:
@@ -1825,54 +2705,68 @@ class KickMinerApp:
         except Exception:
             pass
         cols = max(2, min(5, canvas_width // 210))
-        for col in range(cols):
-            self.settings_games_frame.columnconfigure(col, weight=1, uniform="settings-game-card")
+        layout = (cols, tuple(all_games))
+        relayout = layout != self._settings_game_layout
+        if relayout:
+            for col in range(cols):
+                self.settings_games_frame.columnconfigure(col, weight=1, uniform="settings-game-card")
+            self._settings_game_layout = layout
 
         for idx, game in enumerate(all_games):
-            row = idx // cols
-            col = idx % cols
             selected_now = game in selected
-            bg = "#d9f7df" if selected_now else "#f0f0f0"
-            fg = "#1f8f4a" if selected_now else "#1f1f1f"
             display_name = self._tr(ALL_GAMES_LABEL) if game == ALL_GAMES_TOKEN else game
-
-            card = tk.Frame(
-                self.settings_games_frame,
-                bd=1,
-                relief="solid",
-                bg=bg,
-                highlightthickness=1,
-                highlightbackground="#87c995" if selected_now else "#cfcfcf",
-            )
-            card.grid(row=row, column=col, sticky="nsew", padx=6, pady=6)
-            self._settings_game_cards[game] = card
-
             img_url = self._settings_game_images.get(game, "")
             thumb = self._get_reward_thumb(img_url)
-            img_label = tk.Label(card, image=thumb, bg=bg)
-            img_label.image = thumb
-            img_label.pack(anchor="center", padx=8, pady=(8, 6))
+            card = self._settings_game_cards.get(game)
+            if card is None:
+                bg = "#d9f7df" if selected_now else "#f0f0f0"
+                fg = "#1f8f4a" if selected_now else "#1f1f1f"
+                card = tk.Frame(
+                    self.settings_games_frame,
+                    bd=1,
+                    relief="solid",
+                    bg=bg,
+                    highlightthickness=1,
+                    highlightbackground="#87c995" if selected_now else "#cfcfcf",
+                )
+                self._settings_game_cards[game] = card
+
+                img_label = tk.Label(card, image=thumb, bg=bg)
+                img_label.image = thumb
+                img_label.pack(anchor="center", padx=8, pady=(8, 6))
+                self._settings_game_img_labels[game] = img_label
+
+                var = tk.BooleanVar(value=selected_now)
+                self._settings_game_vars[game] = var
+                check = tk.Checkbutton(
+                    card,
+                    text=display_name,
+                    variable=var,
+                    bg=bg,
+                    activebackground=bg,
+                    fg=fg,
+                    activeforeground=fg,
+                    selectcolor=bg,
+                    wraplength=170,
+                    justify=tk.CENTER,
+                    anchor="center",
+                    command=lambda g=game: self._on_settings_game_toggle(g),
+                )
+                check.pack(fill=tk.X, padx=6, pady=(0, 8))
+                self._settings_game_checks[game] = check
+            else:
+                var = self._settings_game_vars[game]
+                if bool(var.get()) != selected_now:
+                    var.set(selected_now)
+                img_label = self._settings_game_img_labels.get(game)
+                if img_label is not None and getattr(img_label, "image", None) is not thumb:
+                    img_label.configure(image=thumb)
+                    img_label.image = thumb
+                self._settings_game_checks[game].configure(text=display_name)
             if img_url:
                 self._request_reward_thumb(img_url)
-
-            var = tk.BooleanVar(value=selected_now)
-            self._settings_game_vars[game] = var
-            check = tk.Checkbutton(
-                card,
-                text=display_name,
-                variable=var,
-                bg=bg,
-                activebackground=bg,
-                fg=fg,
-                activeforeground=fg,
-                selectcolor=bg,
-                wraplength=170,
-                justify=tk.CENTER,
-                anchor="center",
-                command=lambda g=game: self._on_settings_game_toggle(g),
-            )
-            check.pack(fill=tk.X, padx=6, pady=(0, 8))
-            self._settings_game_checks[game] = check
+            if relayout:
+                card.grid(row=idx // cols, column=idx % cols, sticky="nsew", padx=6, pady=6)
             self._apply_settings_game_card_style(game)
 
         self._refresh_settings_count_label()
@@ -1883,12 +2777,19 @@ class KickMinerApp:
             return 0
         if not mine_all and not selected_games:
             return 0
-        desired_by_url: dict[str, dict[str, object]] = {}
+        desired_by_url: dict[str, _DesiredChannel] = {}
+        now = time.time()
+        # First pass only collects eligible channels; stale live statuses are
+        # then fetched in parallel so the cold-cache case costs one pooled
+        # round instead of a serial fetch per slug.
+        eligible: list[tuple[KickCampaign, KickChannel, str, str]] = []
+        stale_slugs: list[str] = []
+        seen_slugs: set[str] = set()
         for campaign in self.campaigns:
-            game_key = (campaign.game or "").strip().casefold()
+            game_key = self._campaign_game_key(campaign)
             if not mine_all and game_key not in selected_games:
                 continue
-            if self._is_campaign_expired(campaign):
+            if self._is_campaign_expired(campaign, now):
                 continue
             for channel in campaign.channels:
                 slug = (channel.slug or "").strip()
@@ -1897,23 +2798,34 @@ class KickMinerApp:
                 url = (channel.url or f"https://kick.com/{slug}").strip()
                 if not url:
                     continue
-                live, viewers = self._get_channel_live_snapshot(
-                    slug,
-                    max_age_seconds=45.0,
-                    use_network=True,
+                eligible.append((campaign, channel, slug, url))
+                if slug in seen_slugs:
+                    continue
+                seen_slugs.add(slug)
+                cached = self._channel_live_cache.get(slug)
+                if cached is None or (now - cached[2]) > 45.0:
+                    stale_slugs.append(slug)
+        if stale_slugs:
+            self._prewarm_live_snapshots(stale_slugs)
+        for campaign, channel, slug, url in eligible:
+            live, viewers = self._get_channel_live_snapshot(
+                slug,
+                max_age_seconds=45.0,
+                use_network=False,
+                now=now,
+            )
+            sort_key = self._channel_live_sort_key(live, viewers, channel.slug_key)
+            previous = desired_by_url.get(url)
+            if previous is None or sort_key < previous.sort_key:
+                desired_by_url[url] = _DesiredChannel(
+                    sort_key=sort_key,
+                    campaign=campaign,
+                    channel=channel,
+                    live=live,
+                    viewers=int(viewers),
                 )
-                sort_key = self._channel_live_sort_key(live, viewers, slug)
-                previous = desired_by_url.get(url)
-                if previous is None or sort_key < previous["sort_key"]:
-                    desired_by_url[url] = {
-                        "campaign": campaign,
-                        "channel": channel,
-                        "live": live,
-                        "viewers": int(viewers),
-                        "sort_key": sort_key,
-                    }
-
-        ordered = sorted(desired_by_url.values(), key=lambda d: d["sort_key"])
+
+        ordered = sorted(desired_by_url.values())
         existing_by_url: dict[str, QueueItem] = {}
         for item in self.queue_items:
             if item.url and item.url not in existing_by_url:
@@ -1924,13 +2836,14 @@ class KickMinerApp:
         removed = 0
         ordered_urls: set[str] = set()
         final_queue: list[QueueItem] = []
+        # Checked as items are appended so no trailing element-by-element
+        # comparison of the two lists is needed.
+        same_order = True
 
         for row in ordered:
-            campaign = row["campaign"]
-            channel = row["channel"]
-            viewers = int(row["viewers"])
-            if not isinstance(campaign, KickCampaign) or not isinstance(channel, KickChannel):
-                continue
+            campaign = row.campaign
+            channel = row.channel
+            viewers = row.viewers
             url = str(channel.url or f"https://kick.com/{channel.slug}")
             existing = existing_by_url.get(url)
             if existing is None:
@@ -1968,6 +2881,11 @@ class KickMinerApp:
                 if after != before:
                     updated += 1
             ordered_urls.add(url)
+            if same_order and (
+                len(final_queue) >= len(self.queue_items)
+                or self.queue_items[len(final_queue)] is not existing
+            ):
+                same_order = False
             final_queue.append(existing)
 
         for item in self.queue_items:
@@ -1976,13 +2894,17 @@ class KickMinerApp:
             if self._is_auto_games_channel_item(item):
                 removed += 1
                 continue
+            if same_order and (
+                len(final_queue) >= len(self.queue_items)
+                or self.queue_items[len(final_queue)] is not item
+            ):
+                same_order = False
             final_queue.append(item)
 
-        order_or_size_changed = len(final_queue) != len(self.queue_items) or any(
-            a is not b for a, b in zip(final_queue, self.queue_items)
-        )
+        order_or_size_changed = len(final_queue) != len(self.queue_items) or not same_order
         if order_or_size_changed:
             self.queue_items = final_queue
+            self._reindex_queue_items()
 
         if added or updated or removed:
             self.post_log(
@@ -1994,9 +2916,9 @@ class KickMinerApp:
         cid = str(campaign_id or "").strip()
         cname = str(campaign_name or "").strip().lower()
         for item in self.queue_items:
-            if cid and str(item.campaign_id or "").strip() == cid:
+            if cid and item.campaign_id_key == cid:
                 return item
-            if cname and str(item.campaign_name or "").strip().lower() == cname:
+            if cname and item.campaign_name_key == cname:
                 return item
         return None
 
@@ -2010,7 +2932,7 @@ class KickMinerApp:
         if item.campaign_id:
             campaign = campaign_by_id.get(item.campaign_id)
         if campaign is None and item.campaign_name:
-            campaign = campaign_by_name.get(item.campaign_name.strip().lower())
+            campaign = campaign_by_name.get(item.campaign_name_key)
         return campaign
 
     def _get_channel_live_snapshot(
@@ -2019,8 +2941,10 @@ class KickMinerApp:
         *,
         max_age_seconds: float = 45.0,
         use_network: bool = True,
+        now: float | None = None,
     ) -> tuple[bool | None, int]:
-        now = time.time()
+        if now is None:
+            now = time.time()
         cached = self._channel_live_cache.get(slug)
         if cached is not None and (now - cached[2]) <= max_age_seconds:
             return (cached[0], cached[1])
@@ -2039,6 +2963,33 @@ class KickMinerApp:
                 return (cached[0], cached[1])
             return (None, 0)
 
+    def _prewarm_live_snapshots(self, slugs: list[str]) -> None:
+        # Fetch stale live statuses with a small pool; failures simply leave
+        # the old cache entry (or none) in place, matching the serial path.
+        def probe(slug: str) -> None:
+            try:
+                info = self.browser.channel_live_status(None, slug)
+                live = bool(info.get("live", False))
+                viewers = int(info.get("viewer_count") or 0)
+            except Exception:
+                return
+            self._channel_live_cache[slug] = (live, viewers, time.time())
+
+        with ThreadPoolExecutor(max_workers=8, thread_name_prefix="live") as pool:
+            for _ in pool.map(probe, slugs):
+                pass
+
+    _LIVE_CACHE_MAX_AGE = 600.0
+
+    def _prune_live_cache(self) -> None:
+        # Long sessions accumulate one entry per slug ever seen; drop the
+        # ones no caller could use any more so the dict stays bounded.
+        cutoff = time.time() - self._LIVE_CACHE_MAX_AGE
+        for slug in [s for s, entry in self._channel_live_cache.items() if entry[2] < cutoff]:
+            del self._channel_live_cache[slug]
+        if not self._shutting_down:
+            self.root.after(300_000, self._prune_live_cache)
+
     def _pick_preferred_channel_for_campaign(
         self,
         campaign: KickCampaign,
@@ -2095,71 +3046,86 @@ class KickMinerApp:
     def get_next_queue_item(self) -> QueueItem | None:
         mine_all, selected_games = self._preferred_game_filter()
         auto_filter = (not mine_all) and bool(selected_games)
-        campaign_by_id = {campaign.id: campaign for campaign in self.campaigns if campaign.id}
-        campaign_by_name = {
-            (campaign.name or "").strip().lower(): campaign
-            for campaign in self.campaigns
-            if (campaign.name or "").strip()
-        }
-        progress_by_id = {campaign.id: campaign for campaign in self.progress if campaign.id}
-        progress_by_name = {
-            (campaign.name or "").strip().lower(): campaign
-            for campaign in self.progress
-            if (campaign.name or "").strip()
-        }
-        hint_id = str(self._retry_campaign_hint_id or "").strip()
-        hint_name = str(self._retry_campaign_hint_name or "").strip().lower()
-        ordered_items: list[QueueItem]
+        campaign_by_id, campaign_by_name, progress_by_id, progress_by_name = self._campaign_indexes()
+        # The hint setter already strips/lowers, so no re-normalization here.
+        hint_id = self._retry_campaign_hint_id or ""
+        hint_name = self._retry_campaign_hint_name or ""
+        # Iterate the queue directly in the common no-hint case; the loop
+        # below mutates item fields, never the list itself.
+        ordered_items: list[QueueItem] = self.queue_items
         if hint_id or hint_name:
             preferred_items: list[QueueItem] = []
             other_items: list[QueueItem] = []
             for item in self.queue_items:
-                item_id = str(item.campaign_id or "").strip()
-                item_name = str(item.campaign_name or "").strip().lower()
+                item_id = item.campaign_id_key
+                item_name = item.campaign_name_key
                 if (hint_id and item_id == hint_id) or (hint_name and item_name == hint_name):
                     preferred_items.append(item)
                 else:
                     other_items.append(item)
             if preferred_items:
-                ordered_items = preferred_items + other_items
+                preferred_items.extend(other_items)
+                ordered_items = preferred_items
             else:
                 self._retry_campaign_hint_id = None
                 self._retry_campaign_hint_name = None
-                ordered_items = list(self.queue_items)
-        else:
-            ordered_items = list(self.queue_items)
         fallback_item: QueueItem | None = None
         fallback_live_viewers = -1
+        now = time.time()
+        # Refresh stale auto-games snapshots in one parallel wave up front so
+        # the loop below never blocks on a serial network call per item.
+        stale_slugs: list[str] = []
+        seen_slugs: set[str] = set()
+        for item in ordered_items:
+            if not item.is_auto_games or item.status in _FINAL_STATUSES:
+                continue
+            slug = item.slug
+            if slug in seen_slugs:
+                continue
+            seen_slugs.add(slug)
+            cached = self._channel_live_cache.get(slug)
+            if cached is None or (now - cached[2]) >= 30.0:
+                stale_slugs.append(slug)
+        if stale_slugs:
+            self._prewarm_live_snapshots(stale_slugs)
+        # Bind the per-item helpers once; LOAD_FAST beats a method lookup per
+        # iteration and the loop calls each of these for most items.
+        resolve_progress = self._resolve_item_progress_campaign
+        progress_finished = self._is_progress_campaign_finished
+        resolve_campaign = self._resolve_queue_item_campaign
+        campaign_expired = self._is_campaign_expired
+        live_snapshot_for = self._get_channel_live_snapshot
+        set_item_channel = self._set_item_channel_for_campaign
         for item in ordered_items:
             if item.minutes_target > 0 and item.done:
                 item.status = "FINISHED"
                 continue
-            progress_campaign = self._resolve_item_progress_campaign(item, progress_by_id, progress_by_name)
-            if self._is_progress_campaign_finished(progress_campaign):
+            progress_campaign = resolve_progress(item, progress_by_id, progress_by_name)
+            if progress_finished(progress_campaign):
                 item.status = "FINISHED"
-            if item.status in {"FINISHED", "EXPIRED"}:
+            if item.status in _FINAL_STATUSES:
                 continue
             if item.status == "STOPPED":
                 item.status = "PENDING"
-            campaign = self._resolve_queue_item_campaign(item, campaign_by_id, campaign_by_name)
-            if self._is_campaign_expired(campaign):
+            campaign = resolve_campaign(item, campaign_by_id, campaign_by_name)
+            if campaign_expired(campaign, now):
                 item.status = "EXPIRED"
                 item.notes = "campaign expired"
                 continue
             if auto_filter and (item.campaign_id or item.campaign_name):
                 if campaign is not None:
-                    game_name = (campaign.game or "").strip().casefold()
+                    game_name = self._campaign_game_key(campaign)
                     if game_name and game_name not in selected_games:
                         continue
-            if self._is_auto_games_channel_item(item):
-                live_snapshot, viewers = self._get_channel_live_snapshot(
+            if item.is_auto_games:
+                live_snapshot, viewers = live_snapshot_for(
                     item.slug,
                     max_age_seconds=30.0,
-                    use_network=True,
+                    use_network=False,
                 )
                 is_live = live_snapshot is True
             else:
-                is_live, viewers = self._set_item_channel_for_campaign(item, campaign, use_network=True)
+                is_live, viewers = set_item_channel(item, campaign, use_network=True)
             if is_live:
                 return item
             if fallback_item is None or viewers > fallback_live_viewers:
@@ -2181,53 +3147,61 @@ class KickMinerApp:
             return
         slug = url.rstrip("/").split("/")[-1].strip().lower()
         linked_campaign = self._find_best_campaign_for_channel_slug(slug)
-        self.queue_items.append(
-            QueueItem(
-                url=url,
-                minutes_target=0,
-                status="PENDING",
-                campaign_id=(linked_campaign.id if linked_campaign else None),
-                campaign_name=(linked_campaign.name if linked_campaign else None),
-                category_id=(linked_campaign.category_id if linked_campaign else None),
-                notes=(f"game={linked_campaign.game}" if linked_campaign else ""),
-            )
+        new_item = QueueItem(
+            url=url,
+            minutes_target=0,
+            status="PENDING",
+            campaign_id=(linked_campaign.id if linked_campaign else None),
+            campaign_name=(linked_campaign.name if linked_campaign else None),
+            category_id=(linked_campaign.category_id if linked_campaign else None),
+            notes=(f"game={linked_campaign.game}" if linked_campaign else ""),
         )
-        self._refresh_queue_tree()
+        self.queue_items.append(new_item)
+        self._queue_items_by_url[new_item.url] = new_item
+        self._schedule_queue_refresh()
         self.status_var.set(f"Añadido {url}")
 
+    def _campaigns_by_slug(self) -> dict[str, list[KickCampaign]]:
+        # Slug -> campaigns index, rebuilt lazily when the campaign list is
+        # replaced (same version guard as _campaign_indexes).
+        cached = self._campaigns_by_slug_cache
+        if cached is not None and cached[0] == self._campaigns_rev:
+            return cached[1]
+        index: dict[str, list[KickCampaign]] = {}
+        for campaign in self.campaigns:
+            for channel in campaign.channels:
+                key = channel.slug_key
+                if key:
+                    bucket = index.setdefault(key, [])
+                    if campaign not in bucket:
+                        bucket.append(campaign)
+        self._campaigns_by_slug_cache = (self._campaigns_rev, index)
+        return index
+
     def _find_best_campaign_for_channel_slug(self, slug: str) -> KickCampaign | None:
         slug_norm = (slug or "").strip().lower()
         if not slug_norm:
             return None
-        candidates: list[KickCampaign] = []
-        for campaign in self.campaigns:
-            for channel in campaign.channels:
-                if (channel.slug or "").strip().lower() == slug_norm:
-                    candidates.append(campaign)
-                    break
+        candidates = self._campaigns_by_slug().get(slug_norm)
         if not candidates:
             return None
         non_expired = [campaign for campaign in candidates if not self._is_campaign_expired(campaign)]
         if non_expired:
             candidates = non_expired
 
-        finished_tokens = {"claimed", "completed", "finished", "done", "expired", "ended"}
-        active_tokens = {"in_progress", "active", "running", "ongoing"}
-
         def _score(campaign: KickCampaign) -> tuple[int, int]:
             status = str(campaign.progress_status or campaign.status or "").strip().lower()
             claimed = sum(1 for reward in campaign.rewards if reward.claimed)
             pending = max(0, len(campaign.rewards) - claimed)
-            if status in active_tokens:
+            if status in _ACTIVE_CAMPAIGN_TOKENS:
                 phase = 0
-            elif status in finished_tokens:
+            elif status in _FINISHED_CAMPAIGN_TOKENS:
                 phase = 2
             else:
                 phase = 1
             return (phase, -pending)
 
-        candidates.sort(key=_score)
-        return candidates[0]
+        return min(candidates, key=_score)
 
     def _on_queue_tree_right_click(self, event) -> str:
         row_id = self.queue_tree.identify_row(event.y)
@@ -2244,44 +3218,54 @@ class KickMinerApp:
         selected = list(self.queue_tree.selection())
         if not selected:
             return
-        for idx in sorted((int(iid) for iid in selected), reverse=True):
-            if 0 <= idx < len(self.queue_items):
-                self.queue_items.pop(idx)
-        self._refresh_queue_tree()
+        # One filtering pass instead of popping per index (each pop shifts
+        # the tail, O(N) apiece).
+        drop = {int(iid) for iid in selected}
+        kept = [item for idx, item in enumerate(self.queue_items) if idx not in drop]
+        if len(kept) != len(self.queue_items):
+            self.queue_items = kept
+            self._reindex_queue_items()
+        self._schedule_queue_refresh()
 
     def move_selected_up(self) -> None:
         selected = [int(iid) for iid in self.queue_tree.selection()]
         if not selected:
             return
+        items = self.queue_items
+        n = len(items)
         for idx in sorted(selected):
-            if idx <= 0 or idx >= len(self.queue_items):
+            if idx <= 0 or idx >= n:
                 continue
-            self.queue_items[idx - 1], self.queue_items[idx] = self.queue_items[idx], self.queue_items[idx - 1]
-        self._refresh_queue_tree()
-        for idx in [max(0, i - 1) for i in selected]:
-            if idx < len(self.queue_items):
-                self.queue_tree.selection_add(str(idx))
+            items[idx - 1], items[idx] = items[idx], items[idx - 1]
+        self._schedule_queue_refresh()
+        self.queue_tree.selection_set(
+            [str(idx) for idx in {max(0, i - 1) for i in selected} if idx < n]
+        )
 
     def move_selected_down(self) -> None:
         selected = [int(iid) for iid in self.queue_tree.selection()]
         if not selected:
             return
+        items = self.queue_items
+        n = len(items)
         for idx in sorted(selected, reverse=True):
-            if idx < 0 or idx >= len(self.queue_items) - 1:
+            if idx < 0 or idx >= n - 1:
                 continue
-            self.queue_items[idx + 1], self.queue_items[idx] = self.queue_items[idx], self.queue_items[idx + 1]
-        self._refresh_queue_tree()
-        for idx in [min(len(self.queue_items) - 1, i + 1) for i in selected]:
-            if idx >= 0:
-                self.queue_tree.selection_add(str(idx))
+            items[idx + 1], items[idx] = items[idx], items[idx + 1]
+        self._schedule_queue_refresh()
+        self.queue_tree.selection_set(
+            [str(idx) for idx in {min(n - 1, i + 1) for i in selected} if idx >= 0]
+        )
 
     def clear_finished_queue_items(self) -> None:
-        before = len(self.queue_items)
-        self.queue_items = [item for item in self.queue_items if item.status != "FINISHED" and not item.done]
-        removed = before - len(self.queue_items)
-        self._refresh_queue_tree()
-        if removed:
-            self.status_var.set(f"Eliminados {removed} elementos terminados")
+        kept = [item for item in self.queue_items if item.status != "FINISHED" and not item.done]
+        removed = len(self.queue_items) - len(kept)
+        if not removed:
+            return
+        self.queue_items = kept
+        self._reindex_queue_items()
+        self._schedule_queue_refresh()
+        self.status_var.set(f"Eliminados {removed} elementos terminados")
 
     def open_selected_queue_channel(self) -> None:
         sel = self.queue_tree.selection()
@@ -2299,7 +3283,7 @@ class KickMinerApp:
                 item.elapsed_seconds = 0
                 item.status = "PENDING"
                 item.notes = ""
-        self._refresh_queue_tree()
+        self._schedule_queue_refresh()
 
     def change_channel_now(self) -> None:
         target_item: QueueItem | None = None
@@ -2315,7 +3299,7 @@ class KickMinerApp:
             target_item = self._find_item_by_url(self.worker.current_url)
         if target_item is None:
             for item in self.queue_items:
-                if item.status not in {"FINISHED", "EXPIRED"}:
+                if item.status not in _FINAL_STATUSES:
                     target_item = item
                     break
         if target_item is None:
@@ -2325,7 +3309,7 @@ class KickMinerApp:
         target_item.status = "RETRY"
         target_item.notes = "cambio manual solicitado"
         self._ui_rotate_item(target_item.url)
-        self._refresh_queue_tree()
+        self._schedule_queue_refresh()
         self._ensure_queue_worker_running()
         self.post_log(f"Cambio manual: {target_item.slug} -> siguiente canal disponible")
 
@@ -2424,7 +3408,7 @@ class KickMinerApp:
                 self._auto_login_running = False
                 self._dispatch("_ui_set_auto_login_state", False)
 
-        threading.Thread(target=task, daemon=True).start()
+        self._bg_pool.submit(task)
 
     def refresh_session_status(
         self,
@@ -2470,7 +3454,7 @@ class KickMinerApp:
                         f"La sesion guardada no es valida ({label}). Debes iniciar sesion de nuevo.",
                     )
 
-        threading.Thread(target=task, daemon=True).start()
+        self._bg_pool.submit(task)
 
     def save_interactive_cookies(self) -> None:
         source = self.cookie_source_var.get().strip() or "chrome"
@@ -2493,7 +3477,7 @@ class KickMinerApp:
                 self.post_log(f"Importación de cookies falló: {exc}")
                 self._dispatch("_ui_messagebox_error", "Importar cookies", str(exc))
 
-        threading.Thread(target=task, daemon=True).start()
+        self._bg_pool.submit(task)
 
     def open_drops_inventory_page(self) -> None:
         self._close_managed_driver("_inventory_driver")
@@ -2516,7 +3500,7 @@ class KickMinerApp:
                     except Exception:
                         pass
 
-        threading.Thread(target=task, daemon=True).start()
+        self._bg_pool.submit(task)
 
     def auto_claim_now(self) -> None:
         def task():
@@ -2540,7 +3524,7 @@ class KickMinerApp:
                     except Exception:
                         pass
 
-        threading.Thread(target=task, daemon=True).start()
+        self._bg_pool.submit(task)
 
     def refresh_campaigns_only(self) -> None:
         if self._session_state != "logged_in":
@@ -2588,7 +3572,7 @@ class KickMinerApp:
             finally:
                 self._refresh_campaigns_running = False
 
-        threading.Thread(target=task, daemon=True).start()
+        self._bg_pool.submit(task)
 
     def refresh_progress(self, *, silent: bool = False) -> None:
         if self._session_state != "logged_in":
@@ -2614,29 +3598,28 @@ class KickMinerApp:
             finally:
                 self._refresh_progress_running = False
 
-        threading.Thread(target=task, daemon=True).start()
+        self._bg_pool.submit(task)
 
     def _ui_set_campaigns(self, campaigns: list[KickCampaign]) -> None:
         self.campaigns = campaigns
         self._last_campaigns_refresh_ts = time.time()
+        self._campaign_expired_cache.clear()
+        self._campaign_game_keys.clear()
+        self._campaigns_rev += 1
         self.campaign_map = {c.id: c for c in campaigns}
-        self._refresh_campaign_tree()
         self._refresh_campaign_detail(None)
-        self._refresh_settings_games_list()
-        self._refresh_inventory_view()
-        self._auto_queue_selected_games()
-        self._refresh_queue_tree()
-        self._ensure_queue_worker_running()
+        self._do_post_refresh_updates()
 
     def _ui_set_progress(self, progress: list[KickProgressCampaign]) -> None:
         self.progress = progress
         self._last_progress_refresh_ts = time.time()
+        self._campaign_expired_cache.clear()
+        self._progress_rev += 1
         if self.campaigns:
             merge_campaigns_with_progress(self.campaigns, self.progress)
-            self._refresh_campaign_tree()
             self._refresh_campaign_detail(self._selected_campaign())
         self._refresh_inventory_view()
-        self._refresh_queue_tree()
+        self._schedule_queue_refresh()
         self._ensure_queue_worker_running()
 
     def _ui_set_campaigns_and_progress(
@@ -2648,22 +3631,27 @@ class KickMinerApp:
         self.progress = progress
         self._last_progress_refresh_ts = time.time()
         self._last_campaigns_refresh_ts = time.time()
+        self._campaign_expired_cache.clear()
+        self._campaign_game_keys.clear()
+        self._campaigns_rev += 1
+        self._progress_rev += 1
         self.campaign_map = {c.id: c for c in campaigns}
-        self._refresh_campaign_tree()
         self._refresh_campaign_detail(None)
+        self._do_post_refresh_updates()
+
+    def _do_post_refresh_updates(self) -> None:
+        # Shared tail of the campaign setters: rebuild the dependent views
+        # once, then let the worker pick up the new data. The queue tree
+        # itself goes through the coalesced idle refresh.
         self._refresh_settings_games_list()
         self._refresh_inventory_view()
         self._auto_queue_selected_games()
-        self._refresh_queue_tree()
+        self._schedule_queue_refresh()
         self._ensure_queue_worker_running()
 
-    def _refresh_campaign_tree(self) -> None:
-        # Tab Inventario en modo visual-only: no hay tabla interactiva de campañas.
-        return
-
     def _refresh_progress_tree(self) -> None:
         # Progreso integrado en la vista de cola.
-        self._refresh_queue_tree()
+        self._schedule_queue_refresh()
 
     def _selected_campaign(self) -> KickCampaign | None:
         return None
@@ -2686,12 +3674,12 @@ class KickMinerApp:
         return "-"
 
     def _probe_campaign_channels_live(self, campaign: KickCampaign, probe_token: int) -> None:
-        rate_limited = False
+        now = time.time()
+        stale_slugs: list[str] = []
         for channel in campaign.channels:
             if probe_token != self._campaign_live_probe_token:
                 return
             slug = channel.slug
-            now = time.time()
             cached = self._channel_live_cache.get(slug)
             if cached is not None and (now - cached[2]) < 120:
                 self._dispatch(
@@ -2702,17 +3690,17 @@ class KickMinerApp:
                     cached[1],
                     probe_token,
                 )
-                continue
-            if rate_limited:
-                self._dispatch(
-                    "_ui_update_campaign_channel_live",
-                    campaign.id,
-                    slug,
-                    None,
-                    0,
-                    probe_token,
-                )
-                continue
+            else:
+                stale_slugs.append(slug)
+        if not stale_slugs:
+            return
+
+        rate_limited = False
+
+        def fetch(slug: str) -> tuple[str, bool | None, int]:
+            nonlocal rate_limited
+            if rate_limited or probe_token != self._campaign_live_probe_token:
+                return slug, None, 0
             try:
                 info = self.browser.channel_live_status(None, slug)
                 live = bool(info.get("live", False))
@@ -2720,19 +3708,27 @@ class KickMinerApp:
             except Exception as exc:
                 live = None
                 viewers = 0
-                if "429" in str(exc):
+                if "429" in str(exc) and not rate_limited:
                     rate_limited = True
                     self.post_log("Rate limit consultando estado LIVE de canales de campaña. Se muestra estado desconocido.")
             self._channel_live_cache[slug] = (live, viewers, time.time())
-            self._dispatch(
-                "_ui_update_campaign_channel_live",
-                campaign.id,
-                slug,
-                live,
-                viewers,
-                probe_token,
-            )
-            time.sleep(0.08)
+            return slug, live, viewers
+
+        # Cache misses go out in parallel; a stale probe token or a 429 makes
+        # the remaining fetches fall through as "unknown" instead of queueing
+        # more requests behind a rate limit.
+        with ThreadPoolExecutor(max_workers=6, thread_name_prefix="campaign-live") as pool:
+            for slug, live, viewers in pool.map(fetch, stale_slugs):
+                if probe_token != self._campaign_live_probe_token:
+                    return
+                self._dispatch(
+                    "_ui_update_campaign_channel_live",
+                    campaign.id,
+                    slug,
+                    live,
+                    viewers,
+                    probe_token,
+                )
 
     def _ui_update_campaign_channel_live(
         self,
@@ -2754,6 +3750,7 @@ class KickMinerApp:
         return
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def _effective_reward_image_url(reward_url: str | None, campaign_image_url: str | None) -> str:
         reward = str(reward_url or "").strip()
         campaign_img = str(campaign_image_url or "").strip()
@@ -2782,25 +3779,37 @@ class KickMinerApp:
             if not silent:
                 messagebox.showinfo(self._tr("Ya existe"), self._tr("Ese canal ya está en la cola"), parent=self.root)
             return False
-        self.queue_items.append(
-            QueueItem(
-                url=url,
-                minutes_target=0,
-                status="PENDING",
-                campaign_id=campaign.id,
-                campaign_name=campaign.name,
-                category_id=campaign.category_id,
-                notes=f"game={campaign.game}",
-            )
+        new_item = QueueItem(
+            url=url,
+            minutes_target=0,
+            status="PENDING",
+            campaign_id=campaign.id,
+            campaign_name=campaign.name,
+            category_id=campaign.category_id,
+            notes=f"game={campaign.game}",
         )
+        self.queue_items.append(new_item)
+        self._queue_items_by_url[new_item.url] = new_item
         if not silent:
-            self._refresh_queue_tree()
+            self._schedule_queue_refresh()
             self.status_var.set(f"Añadido {url} ({campaign.name})")
         return True
 
 
+_STARTUP_MESSAGES = (
+    "Aplicación iniciada",
+    "La app intentara restaurar la sesion guardada automaticamente al iniciar.",
+    "Si no hay sesion valida, pulsa 'Iniciar sesion' para autenticar de nuevo.",
+)
+
+
 def main() -> None:
     if sys.platform == "win32":
+        # Imported here: the DPI shim is the only ctypes consumer and this
+        # branch is dead code everywhere else, so other platforms skip the
+        # module load entirely.
+        import ctypes
+
         try:
             ctypes.windll.shcore.SetProcessDpiAwareness(2)
         except Exception:
@@ -2810,30 +3819,31 @@ def main() -> None:
                 pass
     root = tk.Tk()
     _apply_window_icon(root)
+    base_dir = _app_base_dir()
     try:
+        # Read phase first (style handle, family probe, named-font lookups),
+        # then all mutations back to back: interleaving queries between
+        # configure calls makes Tk re-validate the option database each time.
         style = ttk.Style(root)
-        available = set(tkfont.families(root))
-        if "Segoe UI" in available:
-            family = "Segoe UI"
-        elif "Tahoma" in available:
-            family = "Tahoma"
-        else:
-            family = "TkDefaultFont"
+        family = _load_cached_ui_family(base_dir)
+        if family is None:
+            family = _preferred_ui_family()
+            _store_cached_ui_family(base_dir, family)
         default_font = tkfont.nametofont("TkDefaultFont")
-        default_font.configure(family=family, size=10)
         text_font = tkfont.nametofont("TkTextFont")
-        text_font.configure(family=family, size=10)
         heading_font = tkfont.nametofont("TkHeadingFont")
+        default_font.configure(family=family, size=10)
+        text_font.configure(family=family, size=10)
         heading_font.configure(family=family, size=10, weight="bold")
         root.option_add("*Font", default_font)
         style.configure(".", font=default_font)
         style.configure("Treeview.Heading", font=heading_font)
     except Exception:
         pass
-    app = KickMinerApp(root, _app_base_dir())
-    app.post_log("Aplicación iniciada")
-    app.post_log("La app intentara restaurar la sesion guardada automaticamente al iniciar.")
-    app.post_log("Si no hay sesion valida, pulsa 'Iniciar sesion' para autenticar de nuevo.")
+    app = KickMinerApp(root, base_dir)
+    # One batched insert once the event loop is idle, instead of three
+    # separate log dispatches queued before the first frame paints.
+    root.after_idle(app.post_log_batch, list(_STARTUP_MESSAGES))
     root.mainloop()
 
 
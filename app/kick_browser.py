@@ -4,6 +4,7 @@ import json
 import time
 import shutil
 import logging
+import functools
 import sys
 import importlib
 import tempfile
@@ -25,6 +26,21 @@ class KickBrowserError(RuntimeError):
     pass
 
 
+@functools.lru_cache(maxsize=1)
+def _load_cookies_cached(path_str: str, mtime_ns: int) -> tuple[dict[str, Any], ...]:
+    # Keyed by (path, mtime_ns): repeated reads of an unchanged cookie file
+    # skip the JSON parse; any rewrite bumps the mtime and invalidates the entry.
+    del mtime_ns
+    try:
+        with open(path_str, "r", encoding="utf-8") as f:
+            cookies = json.load(f)
+    except Exception as exc:
+        raise KickBrowserError(f"Failed to read cookie file: {path_str}") from exc
+    if not isinstance(cookies, list):
+        raise KickBrowserError("Cookie file format is invalid")
+    return tuple(c for c in cookies if isinstance(c, dict))
+
+
 def _compact_json(value: Any) -> str:
     return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
 
@@ -343,16 +359,11 @@ if (originalQuery) {
         return len(cookies)
 
     def _load_saved_cookies(self) -> list[dict[str, Any]]:
-        if not self.cookie_file.exists():
-            return []
         try:
-            with self.cookie_file.open("r", encoding="utf-8") as f:
-                cookies = json.load(f)
-        except Exception as exc:
-            raise KickBrowserError(f"Failed to read cookie file: {self.cookie_file}") from exc
-        if not isinstance(cookies, list):
-            raise KickBrowserError("Cookie file format is invalid")
-        return [c for c in cookies if isinstance(c, dict)]
+            mtime_ns = self.cookie_file.stat().st_mtime_ns
+        except OSError:
+            return []
+        return list(_load_cookies_cached(str(self.cookie_file), mtime_ns))
 
     def _build_driver(
         self,
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass, field, asdict
 from typing import Any
 
 
 Json = dict[str, Any]
 
+# Marker embedded in QueueItem.notes for channels the auto-games scan
+# manages; lives here so the dataclass can derive its flag from it.
+AUTO_GAMES_CHANNEL_SOURCE = "source=auto-games-channel"
+
 
 def _safe_int(value: Any, default: int = 0) -> int:
     try:
@@ -31,6 +36,16 @@ class KickChannel:
     username: str
     url: str
     profile_picture: str = ""
+    # Normalized once here so lookups don't re-run strip/lower per pass;
+    # interned because the same slugs repeat across campaigns.
+    _slug_key: str = field(default="", repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._slug_key = sys.intern((self.slug or "").strip().lower())
+
+    @property
+    def slug_key(self) -> str:
+        return self._slug_key
 
     @classmethod
     def from_campaign_channel(cls, data: Json) -> "KickChannel | None":
@@ -87,6 +102,14 @@ class KickCampaign:
     progress_status: str = "not_started"
     progress_units: int = 0
     raw: Json = field(default_factory=dict, repr=False)
+    _name_key: str = field(default="", repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._name_key = sys.intern((self.name or "").strip().lower())
+
+    @property
+    def name_key(self) -> str:
+        return self._name_key
 
     @classmethod
     def from_api(cls, data: Json) -> "KickCampaign":
@@ -164,6 +187,14 @@ class KickProgressCampaign:
     category_name: str = "Unknown"
     rewards: list[KickProgressReward] = field(default_factory=list)
     raw: Json = field(default_factory=dict, repr=False)
+    _name_key: str = field(default="", repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._name_key = sys.intern((self.name or "").strip().lower())
+
+    @property
+    def name_key(self) -> str:
+        return self._name_key
 
     @classmethod
     def from_api(cls, data: Json) -> "KickProgressCampaign":
@@ -208,11 +239,58 @@ class QueueItem:
     url: str
     minutes_target: int = 0
     elapsed_seconds: int = 0
+    # Declared before `status` so the generated __init__ assigns the default
+    # first and the status assignment below recomputes it.
+    _status_upper: str = field(default="PENDING", repr=False, compare=False)
     status: str = "PENDING"
+    _campaign_id_key: str = field(default="", repr=False, compare=False)
     campaign_id: str | None = None
+    _campaign_name_key: str = field(default="", repr=False, compare=False)
     campaign_name: str | None = None
     category_id: int | None = None
+    _is_auto_games: bool = field(default=False, repr=False, compare=False)
     notes: str = ""
+    # Serialized snapshot reused by to_dict() until any field changes; items
+    # are saved every few seconds and usually have not moved in between.
+    _dict_cache: Json | None = field(default=None, repr=False, compare=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name != "_dict_cache":
+            object.__setattr__(self, "_dict_cache", None)
+        if name == "status" and type(value) is str:
+            # Interned: the handful of status values recur across every item,
+            # so `item.status == "FINISHED"` and set lookups short-circuit on
+            # identity instead of comparing characters.
+            value = sys.intern(value)
+        object.__setattr__(self, name, value)
+        if name == "status":
+            object.__setattr__(self, "_status_upper", sys.intern(str(value or "").upper()))
+        elif name == "campaign_id":
+            object.__setattr__(self, "_campaign_id_key", str(value or "").strip())
+        elif name == "campaign_name":
+            object.__setattr__(
+                self, "_campaign_name_key", sys.intern(str(value or "").strip().lower())
+            )
+        elif name == "notes":
+            object.__setattr__(
+                self, "_is_auto_games", AUTO_GAMES_CHANNEL_SOURCE in str(value or "")
+            )
+
+    @property
+    def status_upper(self) -> str:
+        return self._status_upper
+
+    @property
+    def campaign_id_key(self) -> str:
+        return self._campaign_id_key
+
+    @property
+    def campaign_name_key(self) -> str:
+        return self._campaign_name_key
+
+    @property
+    def is_auto_games(self) -> bool:
+        return self._is_auto_games
 
     @property
     def slug(self) -> str:
@@ -223,7 +301,21 @@ class QueueItem:
         return self.minutes_target > 0 and self.elapsed_seconds >= self.minutes_target * 60
 
     def to_dict(self) -> Json:
-        return asdict(self)
+        cached = self._dict_cache
+        if cached is not None:
+            return cached
+        data: Json = {
+            "url": self.url,
+            "minutes_target": self.minutes_target,
+            "elapsed_seconds": self.elapsed_seconds,
+            "status": self.status,
+            "campaign_id": self.campaign_id,
+            "campaign_name": self.campaign_name,
+            "category_id": self.category_id,
+            "notes": self.notes,
+        }
+        self._dict_cache = data
+        return data
 
     @classmethod
     def from_dict(cls, data: Json) -> "QueueItem":